@@ -2,36 +2,44 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable
 import logging
+from typing import Final
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_PORT, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.device_registry import DeviceInfo
 
-from .client import AMTClient
 from .control_server import AMTControlServer
-from .server import AMTServer
 from .const import (
     CONF_PASSWORD_A,
     CONF_PASSWORD_B,
     CONF_PASSWORD_C,
     CONF_PASSWORD_D,
     CONF_SCAN_INTERVAL,
+    DATA_MODEL_NAME,
     DEFAULT_CONTROL_PORT,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    ENTITY_PREFIX,
 )
-from .coordinator import AMTCoordinator
+from .coordinator import AMTCoordinator, AMTEntryData
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [
+PLATFORMS: Final[tuple[Platform, ...]] = (
     Platform.ALARM_CONTROL_PANEL,
     Platform.BINARY_SENSOR,
     Platform.BUTTON,
     Platform.SENSOR,
     Platform.SWITCH,
-]
+)
+
+# Device name prefix ("AMT"), uppercased once at import time.
+_ENTITY_PREFIX_UPPER: Final = ENTITY_PREFIX.upper()
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -45,6 +53,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Client mode: HA connects to panel host:port
     # Server mode: panel connects to HA on port
     if host:
+        from .client import AMTClient
+
         backend = AMTClient(
             host=host,
             port=port,
@@ -52,11 +62,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
         mode = "client"
     else:
+        from .server import AMTServer
+
         backend = AMTServer(
             port=port,
             password=password,
         )
-        await backend.start()
         mode = "server"
 
     # Set partition passwords if configured
@@ -67,9 +78,27 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         password_d=entry.data.get(CONF_PASSWORD_D),
     )
 
-    # Start control server for CLI access
+    # Start control server for CLI access. In server mode the panel listener
+    # is bound at the same time; both are independent TCP listeners.
     control_server = AMTControlServer(backend, DEFAULT_CONTROL_PORT)
-    await control_server.start()
+    listeners = [control_server]
+    if mode == "server":
+        listeners.append(backend)
+    results = await asyncio.gather(
+        *(listener.start() for listener in listeners), return_exceptions=True
+    )
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if errors:
+        # Release the ports that did bind so a setup retry can bind them again.
+        await asyncio.gather(
+            *(
+                listener.stop()
+                for listener, result in zip(listeners, results)
+                if not isinstance(result, BaseException)
+            ),
+            return_exceptions=True,
+        )
+        raise errors[0]
 
     # Get scan interval from options or data
     scan_interval = entry.options.get(
@@ -78,19 +107,36 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
 
     # Create coordinator
-    coordinator = AMTCoordinator(hass, backend, scan_interval)
+    coordinator = AMTCoordinator(
+        hass, backend, scan_interval, device_info=_build_device_info(entry)
+    )
 
     # Don't wait for first refresh - panel may not be connected yet
     # The coordinator will return disconnected status until panel connects
-    hass.data[DOMAIN][entry.entry_id] = {
-        "coordinator": coordinator,
-        "control_server": control_server,
-        "backend": backend,
-    }
+    hass.data[DOMAIN][entry.entry_id] = AMTEntryData(
+        coordinator=coordinator,
+        control_server=control_server,
+        backend=backend,
+    )
 
     # Forward entry setup to platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # Fetch the first status in the background so setup is not held up by the
+    # panel handshake. Entities stay unavailable until data arrives.
+    entry.async_create_background_task(
+        hass,
+        coordinator.async_refresh(),
+        name=f"{DOMAIN}_first_refresh_{entry.entry_id}",
+    )
+
+    # Entities register the device with the model known when they are added
+    # (the "AMT" placeholder at startup); later model reports update both the
+    # shared DeviceInfo and the registry.
+    entry.async_on_unload(
+        coordinator.async_add_listener(_device_model_updater(hass, entry, coordinator))
+    )
+
     # Register update listener for options
     entry.async_on_unload(entry.add_update_listener(async_update_options))
 
@@ -104,20 +150,65 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+def _build_device_info(entry: ConfigEntry) -> DeviceInfo:
+    """Return the device information shared by the entities of an entry."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, entry.entry_id)},
+        name=f"{_ENTITY_PREFIX_UPPER} (porta {entry.data[CONF_PORT]})",
+        manufacturer="Intelbras",
+        model="AMT",
+    )
+
+
+def _device_model_updater(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: AMTCoordinator
+) -> Callable[[], None]:
+    """Return a listener that syncs the registry device model with the panel."""
+    device_registry = dr.async_get(hass)
+    identifiers = {(DOMAIN, entry.entry_id)}
+    last_model: str | None = None
+
+    @callback
+    def _update_device_model() -> None:
+        """Update the device model only when the reported model changes."""
+        nonlocal last_model
+        data = coordinator.data
+        model_name = data.get(DATA_MODEL_NAME, "AMT") if data else "AMT"
+        if model_name == last_model:
+            return
+        # Entities added later (zone discovery) register this model.
+        coordinator.device_info["model"] = model_name
+        device = device_registry.async_get_device(identifiers=identifiers)
+        if device is None:
+            return
+        last_model = model_name
+        if device.model != model_name:
+            device_registry.async_update_device(device.id, model=model_name)
+
+    return _update_device_model
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        data = hass.data[DOMAIN].pop(entry.entry_id)
-        coordinator: AMTCoordinator = data["coordinator"]
-        control_server: AMTControlServer = data["control_server"]
-        await control_server.stop()
-        await coordinator.async_shutdown()
+        data: AMTEntryData = hass.data[DOMAIN].pop(entry.entry_id)
+        # Independent sockets: stop both even if one of them fails.
+        results = await asyncio.gather(
+            data.control_server.stop(),
+            data.coordinator.async_shutdown(),
+            return_exceptions=True,
+        )
+        for name, result in zip(("control server", "backend"), results):
+            if isinstance(result, Exception):
+                _LOGGER.warning("Error stopping AMT %s: %s", name, result)
 
     return unload_ok
 
 
 async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    # Cancels a pending setup retry and runs async_reload as a task, so the
+    # options flow returns without waiting for the reload to finish.
+    hass.config_entries.async_schedule_reload(entry.entry_id)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from operator import and_
 from typing import Any
 
 from homeassistant.components.alarm_control_panel import (
@@ -12,22 +13,17 @@ from homeassistant.components.alarm_control_panel import (
     CodeFormat,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_PORT
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DATA_ARMED,
     DATA_CONNECTED,
-    DATA_MODEL_NAME,
-    DATA_PARTITIONS,
     DATA_SIREN,
     DATA_STAY,
     DATA_TRIGGERED,
     DOMAIN,
-    ENTITY_PREFIX,
     MAX_PARTITIONS,
     PARTITION_NAMES,
 )
@@ -35,6 +31,24 @@ from .coordinator import AMTCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Partition letters handled by this platform, resolved once at import time.
+_PARTITIONS: tuple[str, ...] = tuple(
+    PARTITION_NAMES[partition_idx] for partition_idx in range(MAX_PARTITIONS)
+)
+_PARTITION_SUFFIXES: dict[str, str] = {name: name.lower() for name in _PARTITIONS}
+
+# Alarm state keyed by (armed, stay, alerting), where alerting means the siren
+# is on or the panel/partition is armed with the triggered bit set. Stay is
+# only meaningful while armed, so disarmed keys always carry stay=False.
+_STATE_TABLE: dict[tuple[bool, bool, bool], AlarmControlPanelState] = {
+    (False, False, False): AlarmControlPanelState.DISARMED,
+    (False, False, True): AlarmControlPanelState.TRIGGERED,
+    (True, False, False): AlarmControlPanelState.ARMED_AWAY,
+    (True, True, False): AlarmControlPanelState.ARMED_HOME,
+    (True, False, True): AlarmControlPanelState.TRIGGERED,
+    (True, True, True): AlarmControlPanelState.TRIGGERED,
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -42,32 +56,34 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up alarm control panel from a config entry."""
-    coordinator: AMTCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    coordinator: AMTCoordinator = hass.data[DOMAIN][entry.entry_id].coordinator
 
     entities: list[AlarmControlPanelEntity] = [
         AMTAlarmControlPanel(coordinator, entry),
+        # Add partition alarm panels
+        *(
+            AMTPartitionAlarmPanel(coordinator, entry, partition_idx)
+            for partition_idx in range(MAX_PARTITIONS)
+        ),
     ]
 
-    # Add partition alarm panels
-    for partition_idx in range(MAX_PARTITIONS):
-        partition_name = PARTITION_NAMES[partition_idx]
-        entities.append(AMTPartitionAlarmPanel(coordinator, entry, partition_name))
-
     async_add_entities(entities)
 
 
-class AMTAlarmControlPanel(CoordinatorEntity[AMTCoordinator], AlarmControlPanelEntity):
-    """AMT Alarm Control Panel."""
+class AMTAlarmPanelBase(CoordinatorEntity[AMTCoordinator], AlarmControlPanelEntity):
+    """Base class for AMT alarm control panels."""
+
+    __slots__ = ("_entry", "_state_snapshot")
 
     _attr_has_entity_name = True
-    _attr_name = "Central"
     _attr_supported_features = (
         AlarmControlPanelEntityFeature.ARM_HOME
         | AlarmControlPanelEntityFeature.ARM_AWAY
     )
     # The integration already authenticates to the panel using the configured
-    # password (ISEC). Requiring a UI code is confusing and unnecessary for
-    # most setups/automations.
+    # password (ISEC), or the partition password for partition panels.
+    # Requiring a UI code is confusing and unnecessary for most
+    # setups/automations, so HA never prompts for or validates one.
     _attr_code_arm_required = False
     _attr_code_format = None
 
@@ -79,63 +95,66 @@ class AMTAlarmControlPanel(CoordinatorEntity[AMTCoordinator], AlarmControlPanelE
         """Initialize the alarm control panel."""
         super().__init__(coordinator)
         self._entry = entry
-        self._attr_unique_id = f"{entry.entry_id}_alarm_panel"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        model_name = "AMT"
-        if self.coordinator.data:
-            model_name = self.coordinator.data.get(DATA_MODEL_NAME, "AMT")
-
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name=f"{ENTITY_PREFIX.upper()} (porta {self._entry.data[CONF_PORT]})",
-            manufacturer="Intelbras",
-            model=model_name,
-        )
+        self._state_snapshot: tuple[bool, AlarmControlPanelState | None] | None = None
+        self._attr_device_info = coordinator.device_info
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when availability or alarm state changed."""
+        snapshot = (self.available, self.alarm_state)
+        if snapshot == self._state_snapshot:
+            return
+        self._state_snapshot = snapshot
+        super()._handle_coordinator_update()
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        if not self.coordinator.data:
-            return False
-        return self.coordinator.data.get(DATA_CONNECTED, False)
+        return self.coordinator.available
+
+
+class AMTAlarmControlPanel(AMTAlarmPanelBase):
+    """AMT Alarm Control Panel."""
+
+    __slots__ = ("_warned_trigger",)
+
+    _attr_name = "Central"
+
+    def __init__(
+        self,
+        coordinator: AMTCoordinator,
+        entry: ConfigEntry,
+    ) -> None:
+        """Initialize the alarm control panel."""
+        super().__init__(coordinator, entry)
+        self._attr_unique_id = f"{entry.entry_id}_alarm_panel"
+        self._warned_trigger = False
 
     @property
     def alarm_state(self) -> AlarmControlPanelState | None:
         """Return the state of the alarm."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data or not data.get(DATA_CONNECTED, False):
             return None
 
-        if not self.coordinator.data.get(DATA_CONNECTED, False):
-            return None
-
-        armed = self.coordinator.data.get(DATA_ARMED, False)
-        triggered = self.coordinator.data.get(DATA_TRIGGERED, False)
-        siren_on = self.coordinator.data.get(DATA_SIREN, False)
+        armed = bool(data.get(DATA_ARMED, False))
+        triggered = data.get(DATA_TRIGGERED, False)
+        siren_on = data.get(DATA_SIREN, False)
 
         # Only show TRIGGERED if:
         # - Siren is currently on, OR
         # - Alarm is armed AND triggered bit is set
-        if siren_on or (armed and triggered):
-            return AlarmControlPanelState.TRIGGERED
-
-        if armed:
-            # Check central stay flag OR any partition in stay mode
-            stay = self.coordinator.data.get(DATA_STAY, False)
-            if not stay:
-                # Check if any armed partition is in stay mode
-                partitions = self.coordinator.data.get(DATA_PARTITIONS, {})
-                for part_data in partitions.values():
-                    if part_data.get("armed") and part_data.get("stay"):
-                        stay = True
-                        break
-            if stay:
-                return AlarmControlPanelState.ARMED_HOME
-            return AlarmControlPanelState.ARMED_AWAY
-
-        return AlarmControlPanelState.DISARMED
+        alerting = bool(siren_on or (armed and triggered))
+
+        # Check central stay flag OR any armed partition in stay mode
+        stay = False
+        if armed and not alerting:
+            coordinator = self.coordinator
+            stay = bool(data.get(DATA_STAY, False)) or any(
+                map(and_, coordinator.partitions_armed, coordinator.partitions_stay)
+            )
+
+        return _STATE_TABLE[(armed, stay, alerting)]
 
     async def async_alarm_disarm(self, code: str | None = None) -> None:
         """Disarm the alarm."""
@@ -152,80 +171,53 @@ class AMTAlarmControlPanel(CoordinatorEntity[AMTCoordinator], AlarmControlPanelE
 
     async def async_alarm_trigger(self, code: str | None = None) -> None:
         """Trigger the alarm (not supported)."""
+        # Warn once per entity so a looping automation cannot flood the log.
+        if self._warned_trigger:
+            return
+        self._warned_trigger = True
         _LOGGER.warning("Trigger is not supported by AMT alarm panels")
 
 
-class AMTPartitionAlarmPanel(CoordinatorEntity[AMTCoordinator], AlarmControlPanelEntity):
+class AMTPartitionAlarmPanel(AMTAlarmPanelBase):
     """AMT Partition Alarm Control Panel."""
 
-    _attr_has_entity_name = True
-    _attr_supported_features = (
-        AlarmControlPanelEntityFeature.ARM_HOME
-        | AlarmControlPanelEntityFeature.ARM_AWAY
-    )
-    _attr_code_arm_required = False
-    _attr_code_format = None
+    __slots__ = ("_idx", "_partition_name")
 
     def __init__(
         self,
         coordinator: AMTCoordinator,
         entry: ConfigEntry,
-        partition_name: str,
+        partition_idx: int,
     ) -> None:
         """Initialize the partition alarm control panel."""
-        super().__init__(coordinator)
-        self._entry = entry
+        super().__init__(coordinator, entry)
+        partition_name = _PARTITIONS[partition_idx]
+        self._idx = partition_idx
         self._partition_name = partition_name
-        self._attr_unique_id = f"{entry.entry_id}_partition_{partition_name.lower()}_panel"
-        self._attr_name = f"Partição {partition_name}"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        model_name = "AMT"
-        if self.coordinator.data:
-            model_name = self.coordinator.data.get(DATA_MODEL_NAME, "AMT")
-
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name=f"{ENTITY_PREFIX.upper()} (porta {self._entry.data[CONF_PORT]})",
-            manufacturer="Intelbras",
-            model=model_name,
+        self._attr_unique_id = (
+            f"{entry.entry_id}_partition_{_PARTITION_SUFFIXES[partition_name]}_panel"
         )
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        if not self.coordinator.data:
-            return False
-        return self.coordinator.data.get(DATA_CONNECTED, False)
+        self._attr_name = f"Partição {partition_name}"
 
     @property
     def alarm_state(self) -> AlarmControlPanelState | None:
         """Return the state of the partition."""
-        if not self.coordinator.data:
-            return None
-
-        if not self.coordinator.data.get(DATA_CONNECTED, False):
+        coordinator = self.coordinator
+        data = coordinator.data
+        if not data or not data.get(DATA_CONNECTED, False):
             return None
 
-        partitions = self.coordinator.data.get(DATA_PARTITIONS, {})
-        partition_data = partitions.get(self._partition_name, {})
-
-        armed = partition_data.get("armed", False)
-        triggered = partition_data.get("triggered", False)
-        siren_on = self.coordinator.data.get(DATA_SIREN, False)
+        # Per-partition flags are tuples indexed like PARTITION_NAMES.
+        idx = self._idx
+        armed = coordinator.partitions_armed[idx]
+        triggered = coordinator.partitions_triggered[idx]
+        siren_on = data.get(DATA_SIREN, False)
 
         # Show TRIGGERED if siren is on or partition is armed and triggered
-        if siren_on or (armed and triggered):
-            return AlarmControlPanelState.TRIGGERED
-
-        if armed:
-            if partition_data.get("stay", False):
-                return AlarmControlPanelState.ARMED_HOME
-            return AlarmControlPanelState.ARMED_AWAY
+        alerting = bool(siren_on or (armed and triggered))
+        stay = armed and coordinator.partitions_stay[idx]
 
-        return AlarmControlPanelState.DISARMED
+        return _STATE_TABLE[(armed, stay, alerting)]
 
     async def async_alarm_disarm(self, code: str | None = None) -> None:
         """Disarm the partition."""
@@ -2,21 +2,25 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from itertools import chain
 import logging
 from typing import Any
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
+    BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_PORT, EntityCategory
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.const import EntityCategory
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
+    CONF_DISCOVER_ACTIVE_ZONES,
     DATA_AC_POWER,
     DATA_AUX_OVERLOAD,
     DATA_BATTERY_ABSENT,
@@ -24,10 +28,7 @@ from .const import (
     DATA_BATTERY_LOW,
     DATA_BATTERY_SHORT,
     DATA_COMM_FAILURE,
-    DATA_CONNECTED,
     DATA_MAX_ZONES,
-    DATA_MODEL_NAME,
-    DATA_PARTITIONS,
     DATA_PHONE_LINE_CUT,
     DATA_PROBLEM,
     DATA_SIREN,
@@ -39,10 +40,9 @@ from .const import (
     DATA_ZONES_SHORT_CIRCUIT,
     DATA_ZONES_TAMPER,
     DATA_ZONES_VIOLATED,
+    DEFAULT_DISCOVER_ACTIVE_ZONES,
     DOMAIN,
-    ENTITY_PREFIX,
     MAX_PARTITIONS,
-    MAX_ZONES_4010,
     MAX_ZONES_LOW_BATTERY,
     MAX_ZONES_SHORT_CIRCUIT,
     MAX_ZONES_TAMPER,
@@ -53,606 +53,453 @@ from .coordinator import AMTCoordinator
 _LOGGER = logging.getLogger(__name__)
 
 
-async def async_setup_entry(
-    hass: HomeAssistant,
-    entry: ConfigEntry,
-    async_add_entities: AddEntitiesCallback,
-) -> None:
-    """Set up binary sensors from a config entry."""
-    coordinator: AMTCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
-
-    entities: list[BinarySensorEntity] = []
-
-    # Determine max zones from coordinator data
-    max_zones = MAX_ZONES_4010
-    if coordinator.data:
-        max_zones = coordinator.data.get(DATA_MAX_ZONES, MAX_ZONES_4010)
-
-    # Zone sensors (open, violated, bypassed)
-    for zone_num in range(1, max_zones + 1):
-        entities.append(AMTZoneOpenSensor(coordinator, entry, zone_num))
-        entities.append(AMTZoneViolatedSensor(coordinator, entry, zone_num))
-        entities.append(AMTZoneBypassedSensor(coordinator, entry, zone_num))
-
+# Per-zone binary sensors:
+# (data key, unique_id suffix, name suffix, device class, entity category, zone limit)
+# A zone limit of None means every zone reported by the panel; fixed limits
+# are further capped at the panel's zone count.
+_ZONE_SENSORS: tuple[
+    tuple[
+        str,
+        str,
+        str,
+        BinarySensorDeviceClass | None,
+        EntityCategory | None,
+        int | None,
+    ],
+    ...,
+] = (
+    (DATA_ZONES_OPEN, "_open", "", BinarySensorDeviceClass.DOOR, None, None),
+    (
+        DATA_ZONES_VIOLATED,
+        "_violated",
+        " Violada",
+        BinarySensorDeviceClass.MOTION,
+        EntityCategory.DIAGNOSTIC,
+        None,
+    ),
+    (
+        DATA_ZONES_BYPASSED,
+        "_bypassed",
+        " Anulada",
+        None,
+        EntityCategory.DIAGNOSTIC,
+        None,
+    ),
     # Zone tamper sensors (zones 1-18)
-    for zone_num in range(1, MAX_ZONES_TAMPER + 1):
-        entities.append(AMTZoneTamperSensor(coordinator, entry, zone_num))
-
+    (
+        DATA_ZONES_TAMPER,
+        "_tamper",
+        " Tamper",
+        BinarySensorDeviceClass.TAMPER,
+        EntityCategory.DIAGNOSTIC,
+        MAX_ZONES_TAMPER,
+    ),
     # Zone short-circuit sensors (zones 1-18)
-    for zone_num in range(1, MAX_ZONES_SHORT_CIRCUIT + 1):
-        entities.append(AMTZoneShortCircuitSensor(coordinator, entry, zone_num))
-
+    (
+        DATA_ZONES_SHORT_CIRCUIT,
+        "_short_circuit",
+        " Curto-Circuito",
+        BinarySensorDeviceClass.PROBLEM,
+        EntityCategory.DIAGNOSTIC,
+        MAX_ZONES_SHORT_CIRCUIT,
+    ),
     # Zone low battery sensors (wireless zones 1-40)
-    for zone_num in range(1, MAX_ZONES_LOW_BATTERY + 1):
-        entities.append(AMTZoneLowBatterySensor(coordinator, entry, zone_num))
+    (
+        DATA_ZONES_LOW_BATTERY,
+        "_low_battery",
+        " Bateria Fraca",
+        BinarySensorDeviceClass.BATTERY,
+        EntityCategory.DIAGNOSTIC,
+        MAX_ZONES_LOW_BATTERY,
+    ),
+)
 
-    # Partition sensors
-    for partition_idx in range(MAX_PARTITIONS):
-        partition_name = PARTITION_NAMES[partition_idx]
-        entities.append(AMTPartitionSensor(coordinator, entry, partition_name))
 
+# Panel-wide status sensors; the key is both the data key and the unique ID suffix.
+AMT_STATUS_SENSORS: tuple[BinarySensorEntityDescription, ...] = (
     # Status sensors
-    entities.append(AMTACPowerSensor(coordinator, entry))
-    entities.append(AMTBatteryConnectedSensor(coordinator, entry))
-    entities.append(AMTSirenSensor(coordinator, entry))
-    entities.append(AMTProblemSensor(coordinator, entry))
-
+    BinarySensorEntityDescription(
+        key=DATA_AC_POWER,
+        name="Energia AC",
+        device_class=BinarySensorDeviceClass.PLUG,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    BinarySensorEntityDescription(
+        key=DATA_BATTERY_CONNECTED,
+        name="Bateria Conectada",
+        device_class=BinarySensorDeviceClass.BATTERY,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    BinarySensorEntityDescription(
+        key=DATA_SIREN,
+        name="Sirene",
+        device_class=BinarySensorDeviceClass.SOUND,
+    ),
+    BinarySensorEntityDescription(
+        key=DATA_PROBLEM,
+        name="Problema",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
     # Detailed problem sensors
-    entities.append(AMTBatteryLowSensor(coordinator, entry))
-    entities.append(AMTBatteryAbsentSensor(coordinator, entry))
-    entities.append(AMTBatteryShortSensor(coordinator, entry))
-    entities.append(AMTAuxOverloadSensor(coordinator, entry))
-    entities.append(AMTSirenWireCutSensor(coordinator, entry))
-    entities.append(AMTSirenShortSensor(coordinator, entry))
-    entities.append(AMTPhoneLineCutSensor(coordinator, entry))
-    entities.append(AMTCommFailureSensor(coordinator, entry))
+    BinarySensorEntityDescription(
+        key=DATA_BATTERY_LOW,
+        name="Bateria Fraca",
+        device_class=BinarySensorDeviceClass.BATTERY,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    BinarySensorEntityDescription(
+        key=DATA_BATTERY_ABSENT,
+        name="Bateria Ausente",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    BinarySensorEntityDescription(
+        key=DATA_BATTERY_SHORT,
+        name="Bateria em Curto",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    BinarySensorEntityDescription(
+        key=DATA_AUX_OVERLOAD,
+        name="Sobrecarga Aux",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    BinarySensorEntityDescription(
+        key=DATA_SIREN_WIRE_CUT,
+        name="Fio Sirene Cortado",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    BinarySensorEntityDescription(
+        key=DATA_SIREN_SHORT,
+        name="Sirene em Curto",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    BinarySensorEntityDescription(
+        key=DATA_PHONE_LINE_CUT,
+        name="Linha Telefonica Cortada",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    BinarySensorEntityDescription(
+        key=DATA_COMM_FAILURE,
+        name="Falha de Comunicacao",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+)
 
-    async_add_entities(entities)
 
+# Partition sensor attributes keyed by (stay, triggered). The dicts are shared
+# by every partition sensor and never mutated; Home Assistant copies them into
+# the state attributes on each write.
+_PARTITION_ATTRS: dict[tuple[bool, bool], dict[str, Any]] = {
+    (stay, triggered): {"stay": stay, "triggered": triggered}
+    for stay in (False, True)
+    for triggered in (False, True)
+}
+_NO_PARTITION_ATTRS: dict[str, Any] = {}
+
+# Partition sensor (unique_id suffix, name) indexed like PARTITION_NAMES,
+# formatted once at import time.
+_PARTITION_LABELS: tuple[tuple[str, str], ...] = tuple(
+    (f"_partition_{name.lower()}", f"Partição {name}")
+    for name in (PARTITION_NAMES[partition_idx] for partition_idx in range(MAX_PARTITIONS))
+)
 
-class AMTBinarySensorBase(CoordinatorEntity[AMTCoordinator], BinarySensorEntity):
-    """Base class for AMT binary sensors."""
 
-    _attr_has_entity_name = True
+# Zone limit of each per-zone sensor kind, keyed by unique_id suffix.
+_ZONE_LIMITS: dict[str, int | None] = {
+    uid_suffix: limit for _, uid_suffix, _, _, _, limit in _ZONE_SENSORS
+}
 
-    def __init__(
-        self,
-        coordinator: AMTCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the binary sensor."""
-        super().__init__(coordinator)
-        self._entry = entry
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        model_name = "AMT"
-        if self.coordinator.data:
-            model_name = self.coordinator.data.get(DATA_MODEL_NAME, "AMT")
-
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name=f"{ENTITY_PREFIX.upper()} (porta {self._entry.data[CONF_PORT]})",
-            manufacturer="Intelbras",
-            model=model_name,
-        )
+def _zone_limit(limit: int | None, max_zones: int) -> int:
+    """Return the highest zone number a sensor kind gets on this panel."""
+    return min(limit, max_zones) if limit else max_zones
 
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        if not self.coordinator.data:
-            return False
-        return self.coordinator.data.get(DATA_CONNECTED, False)
 
+def _zone_entities(
+    coordinator: AMTCoordinator,
+    entry: ConfigEntry,
+    zone_nums: Iterable[int],
+    max_zones: int,
+) -> list[AMTZoneBitSensor]:
+    """Build every per-zone sensor for the given zones."""
+    c, e = coordinator, entry
+    uid_prefix = f"{entry.entry_id}_zone_"
+    zone_nums = sorted(zone_nums)
+
+    return [
+        AMTZoneBitSensor(
+            c, e, z, key, uid_prefix, uid_suffix, name_suffix, dev_cls, category
+        )
+        for key, uid_suffix, name_suffix, dev_cls, category, limit in _ZONE_SENSORS
+        for z in zone_nums
+        if z <= _zone_limit(limit, max_zones)
+    ]
 
-class AMTZoneOpenSensor(AMTBinarySensorBase):
-    """Zone open sensor."""
 
-    _attr_device_class = BinarySensorDeviceClass.DOOR
+def _remove_zones_over_limit(
+    hass: HomeAssistant, entry: ConfigEntry, max_zones: int
+) -> None:
+    """Remove registry entries of zone sensors past the panel's zone limits.
+
+    Earlier versions created every sensor kind for all MAX_ZONES_4010 zones
+    before the panel reported its zone count.
+    """
+    entity_registry = er.async_get(hass)
+    uid_prefix = f"{entry.entry_id}_zone_"
+    for reg_entry in er.async_entries_for_config_entry(
+        entity_registry, entry.entry_id
+    ):
+        unique_id = reg_entry.unique_id
+        if not unique_id.startswith(uid_prefix):
+            continue
+        zone, _, kind = unique_id[len(uid_prefix) :].partition("_")
+        uid_suffix = "_" + kind
+        if (
+            zone.isdigit()
+            and uid_suffix in _ZONE_LIMITS
+            and int(zone) > _zone_limit(_ZONE_LIMITS[uid_suffix], max_zones)
+        ):
+            entity_registry.async_remove(reg_entry.entity_id)
+
+
+def _registered_zones(hass: HomeAssistant, entry: ConfigEntry) -> set[int]:
+    """Return zone numbers that already have entities in the registry."""
+    uid_prefix = f"{entry.entry_id}_zone_"
+    zones: set[int] = set()
+    for reg_entry in er.async_entries_for_config_entry(
+        er.async_get(hass), entry.entry_id
+    ):
+        unique_id = reg_entry.unique_id
+        if unique_id.startswith(uid_prefix):
+            zone = unique_id[len(uid_prefix) :].partition("_")[0]
+            if zone.isdigit():
+                zones.add(int(zone))
+    return zones
 
-    def __init__(
-        self,
-        coordinator: AMTCoordinator,
-        entry: ConfigEntry,
-        zone_num: int,
-    ) -> None:
-        """Initialize the zone sensor."""
-        super().__init__(coordinator, entry)
-        self._zone_num = zone_num
-        self._attr_unique_id = f"{entry.entry_id}_zone_{zone_num}_open"
-        self._attr_name = f"Zona {zone_num}"
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if zone is open."""
-        if not self.coordinator.data:
-            return None
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up binary sensors from a config entry."""
+    coordinator: AMTCoordinator = hass.data[DOMAIN][entry.entry_id].coordinator
+
+    c, e = coordinator, entry
+
+    discover_zones = entry.options.get(
+        CONF_DISCOVER_ACTIVE_ZONES, DEFAULT_DISCOVER_ACTIVE_ZONES
+    )
+
+    async_add_entities(
+        chain(
+            # Partition sensors
+            (
+                AMTPartitionSensor(c, e, partition_idx)
+                for partition_idx in range(MAX_PARTITIONS)
+            ),
+            # Status and detailed problem sensors
+            (AMTStatusSensor(c, e, description) for description in AMT_STATUS_SENSORS),
+        )
+    )
+
+    # Zone sensors (open, violated, bypassed, tamper, short, low battery) are
+    # added from coordinator updates: the panel's zone count is only known
+    # from its first status, which arrives after platform setup.
+    zones: set[int] = set()
+    zone_limit = 0
+
+    @callback
+    def _add_zones() -> None:
+        """Add zone sensors once the zone count is known, then for new zones."""
+        nonlocal zone_limit
+        if not zone_limit:
+            data = coordinator.data
+            if not data or DATA_MAX_ZONES not in data:
+                return
+            zone_limit = data[DATA_MAX_ZONES]
+            _remove_zones_over_limit(hass, entry, zone_limit)
+            # Zones seen in earlier runs keep their entities; the ones past
+            # the zone count were just removed from the registry.
+            wanted = (
+                _registered_zones(hass, entry)
+                if discover_zones
+                else set(range(1, zone_limit + 1))
+            )
+        elif discover_zones:
+            wanted = set()
+        else:
+            return
+        if discover_zones:
+            # The rest are added once the panel reports any flag set for them.
+            wanted.update(
+                zone_idx + 1
+                for flags in coordinator.zone_flags.values()
+                for zone_idx, flag in enumerate(flags[:zone_limit])
+                if flag
+            )
+        new_zones = wanted - zones
+        if new_zones:
+            zones.update(new_zones)
+            async_add_entities(_zone_entities(c, e, new_zones, zone_limit))
+
+    entry.async_on_unload(coordinator.async_add_listener(_add_zones))
+    _add_zones()
 
-        zones_open = self.coordinator.data.get(DATA_ZONES_OPEN, [])
-        zone_idx = self._zone_num - 1
-        if zone_idx < len(zones_open):
-            return zones_open[zone_idx]
-        return None
 
+class AMTBinarySensorBase(CoordinatorEntity[AMTCoordinator], BinarySensorEntity):
+    """Base class for AMT binary sensors."""
 
-class AMTZoneViolatedSensor(AMTBinarySensorBase):
-    """Zone violated sensor."""
+    __slots__ = ("_entry", "_state_snapshot")
 
-    _attr_device_class = BinarySensorDeviceClass.MOTION
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_has_entity_name = True
 
     def __init__(
         self,
         coordinator: AMTCoordinator,
         entry: ConfigEntry,
-        zone_num: int,
     ) -> None:
-        """Initialize the zone violated sensor."""
-        super().__init__(coordinator, entry)
-        self._zone_num = zone_num
-        self._attr_unique_id = f"{entry.entry_id}_zone_{zone_num}_violated"
-        self._attr_name = f"Zona {zone_num} Violada"
+        """Initialize the binary sensor."""
+        super().__init__(coordinator)
+        self._entry = entry
+        self._state_snapshot: tuple[Any, ...] | None = None
+        self._attr_device_info = coordinator.device_info
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when availability, value or attributes changed."""
+        snapshot = (self.available, self.is_on, self.extra_state_attributes)
+        if snapshot == self._state_snapshot:
+            return
+        self._state_snapshot = snapshot
+        super()._handle_coordinator_update()
 
     @property
-    def is_on(self) -> bool | None:
-        """Return True if zone is violated."""
-        if not self.coordinator.data:
+    def available(self) -> bool:
+        """Return True if entity is available."""
+        return self.coordinator.available
+
+    def _value(self, key: str, default: Any = None) -> Any:
+        """Return a coordinator value, or None when there is no data yet."""
+        data = self.coordinator.data
+        if not data:
             return None
+        return data.get(key, default)
 
-        zones_violated = self.coordinator.data.get(DATA_ZONES_VIOLATED, [])
-        zone_idx = self._zone_num - 1
-        if zone_idx < len(zones_violated):
-            return zones_violated[zone_idx]
-        return None
+    def _zone_bit(self, key: str, zone_num: int) -> bool | None:
+        """Return one zone flag from the coordinator's per-tick snapshot."""
+        flags = self.coordinator.zone_flags.get(key)
+        if flags is None or zone_num > len(flags):
+            return None
+        return flags[zone_num - 1]
 
 
-class AMTZoneBypassedSensor(AMTBinarySensorBase):
-    """Zone bypassed sensor."""
+class AMTZoneBitSensor(AMTBinarySensorBase):
+    """Per-zone flag sensor (open, violated, bypassed, tamper, ...)."""
 
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    __slots__ = ("_zone_num", "_key")
 
     def __init__(
         self,
         coordinator: AMTCoordinator,
         entry: ConfigEntry,
         zone_num: int,
+        key: str,
+        unique_id_prefix: str,
+        unique_id_suffix: str,
+        name_suffix: str,
+        device_class: BinarySensorDeviceClass | None,
+        entity_category: EntityCategory | None,
     ) -> None:
-        """Initialize the zone bypassed sensor."""
+        """Initialize the zone sensor."""
         super().__init__(coordinator, entry)
         self._zone_num = zone_num
-        self._attr_unique_id = f"{entry.entry_id}_zone_{zone_num}_bypassed"
-        self._attr_name = f"Zona {zone_num} Anulada"
+        self._key = key
+        zone = str(zone_num)
+        self._attr_unique_id = unique_id_prefix + zone + unique_id_suffix
+        self._attr_name = "Zona " + zone + name_suffix
+        self._attr_device_class = device_class
+        self._attr_entity_category = entity_category
 
     @property
     def is_on(self) -> bool | None:
-        """Return True if zone is bypassed."""
-        if not self.coordinator.data:
-            return None
-
-        zones_bypassed = self.coordinator.data.get(DATA_ZONES_BYPASSED, [])
-        zone_idx = self._zone_num - 1
-        if zone_idx < len(zones_bypassed):
-            return zones_bypassed[zone_idx]
-        return None
+        """Return True if the zone flag is set."""
+        return self._zone_bit(self._key, self._zone_num)
 
 
 class AMTPartitionSensor(AMTBinarySensorBase):
     """Partition armed sensor."""
 
+    __slots__ = ("_idx", "_attrs_cache")
+
     _attr_device_class = BinarySensorDeviceClass.LOCK
 
     def __init__(
         self,
         coordinator: AMTCoordinator,
         entry: ConfigEntry,
-        partition_name: str,
+        partition_idx: int,
     ) -> None:
         """Initialize the partition sensor."""
         super().__init__(coordinator, entry)
-        self._partition_name = partition_name
-        self._attr_unique_id = f"{entry.entry_id}_partition_{partition_name.lower()}"
-        self._attr_name = f"Partição {partition_name}"
+        unique_id_suffix, name = _PARTITION_LABELS[partition_idx]
+        self._idx = partition_idx
+        self._attr_unique_id = entry.entry_id + unique_id_suffix
+        self._attr_name = name
+        self._attrs_cache: dict[str, Any] = _NO_PARTITION_ATTRS
+        self._refresh_attrs()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh cached attributes before the base class snapshot check."""
+        self._refresh_attrs()
+        super()._handle_coordinator_update()
+
+    def _refresh_attrs(self) -> None:
+        """Select the shared attribute dict for the current stay/triggered flags."""
+        coordinator = self.coordinator
+        if not coordinator.data:
+            self._attrs_cache = _NO_PARTITION_ATTRS
+            return
+        idx = self._idx
+        self._attrs_cache = _PARTITION_ATTRS[
+            coordinator.partitions_stay[idx], coordinator.partitions_triggered[idx]
+        ]
 
     @property
     def is_on(self) -> bool | None:
         """Return True if partition is armed."""
-        if not self.coordinator.data:
-            return None
-
-        partitions = self.coordinator.data.get(DATA_PARTITIONS, {})
-        partition_data = partitions.get(self._partition_name, {})
-        return partition_data.get("armed", False)
+        coordinator = self.coordinator
+        return coordinator.partitions_armed[self._idx] if coordinator.data else None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        if not self.coordinator.data:
-            return {}
-
-        partitions = self.coordinator.data.get(DATA_PARTITIONS, {})
-        partition_data = partitions.get(self._partition_name, {})
-        return {
-            "stay": partition_data.get("stay", False),
-            "triggered": partition_data.get("triggered", False),
-        }
-
-
-class AMTZoneTamperSensor(AMTBinarySensorBase):
-    """Zone tamper sensor."""
-
-    _attr_device_class = BinarySensorDeviceClass.TAMPER
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-
-    def __init__(
-        self,
-        coordinator: AMTCoordinator,
-        entry: ConfigEntry,
-        zone_num: int,
-    ) -> None:
-        """Initialize the zone tamper sensor."""
-        super().__init__(coordinator, entry)
-        self._zone_num = zone_num
-        self._attr_unique_id = f"{entry.entry_id}_zone_{zone_num}_tamper"
-        self._attr_name = f"Zona {zone_num} Tamper"
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if zone has tamper."""
-        if not self.coordinator.data:
-            return None
-
-        zones_tamper = self.coordinator.data.get(DATA_ZONES_TAMPER, [])
-        zone_idx = self._zone_num - 1
-        if zone_idx < len(zones_tamper):
-            return zones_tamper[zone_idx]
-        return None
-
-
-class AMTZoneShortCircuitSensor(AMTBinarySensorBase):
-    """Zone short-circuit sensor."""
-
-    _attr_device_class = BinarySensorDeviceClass.PROBLEM
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-
-    def __init__(
-        self,
-        coordinator: AMTCoordinator,
-        entry: ConfigEntry,
-        zone_num: int,
-    ) -> None:
-        """Initialize the zone short-circuit sensor."""
-        super().__init__(coordinator, entry)
-        self._zone_num = zone_num
-        self._attr_unique_id = f"{entry.entry_id}_zone_{zone_num}_short_circuit"
-        self._attr_name = f"Zona {zone_num} Curto-Circuito"
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if zone has short-circuit."""
-        if not self.coordinator.data:
-            return None
-
-        zones_short = self.coordinator.data.get(DATA_ZONES_SHORT_CIRCUIT, [])
-        zone_idx = self._zone_num - 1
-        if zone_idx < len(zones_short):
-            return zones_short[zone_idx]
-        return None
-
-
-class AMTZoneLowBatterySensor(AMTBinarySensorBase):
-    """Wireless zone low battery sensor."""
-
-    _attr_device_class = BinarySensorDeviceClass.BATTERY
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-
-    def __init__(
-        self,
-        coordinator: AMTCoordinator,
-        entry: ConfigEntry,
-        zone_num: int,
-    ) -> None:
-        """Initialize the zone low battery sensor."""
-        super().__init__(coordinator, entry)
-        self._zone_num = zone_num
-        self._attr_unique_id = f"{entry.entry_id}_zone_{zone_num}_low_battery"
-        self._attr_name = f"Zona {zone_num} Bateria Fraca"
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if wireless zone has low battery."""
-        if not self.coordinator.data:
-            return None
-
-        zones_low_batt = self.coordinator.data.get(DATA_ZONES_LOW_BATTERY, [])
-        zone_idx = self._zone_num - 1
-        if zone_idx < len(zones_low_batt):
-            return zones_low_batt[zone_idx]
-        return None
-
-
-class AMTACPowerSensor(AMTBinarySensorBase):
-    """AC power sensor."""
-
-    _attr_device_class = BinarySensorDeviceClass.PLUG
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_name = "Energia AC"
-
-    def __init__(
-        self,
-        coordinator: AMTCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the AC power sensor."""
-        super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_ac_power"
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if AC power is connected."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get(DATA_AC_POWER, False)
-
+        """Return extra state attributes (cached per coordinator update)."""
+        return self._attrs_cache
 
-class AMTBatteryConnectedSensor(AMTBinarySensorBase):
-    """Battery connected sensor."""
 
-    _attr_device_class = BinarySensorDeviceClass.BATTERY
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_name = "Bateria Conectada"
+class AMTStatusSensor(AMTBinarySensorBase):
+    """Panel status/problem flag described by an entity description."""
 
     def __init__(
         self,
         coordinator: AMTCoordinator,
         entry: ConfigEntry,
+        description: BinarySensorEntityDescription,
     ) -> None:
-        """Initialize the battery connected sensor."""
+        """Initialize the status sensor."""
         super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_battery_connected"
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
 
     @property
     def is_on(self) -> bool | None:
-        """Return True if battery is connected."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get(DATA_BATTERY_CONNECTED, False)
-
-
-class AMTSirenSensor(AMTBinarySensorBase):
-    """Siren sensor."""
-
-    _attr_device_class = BinarySensorDeviceClass.SOUND
-    _attr_name = "Sirene"
-
-    def __init__(
-        self,
-        coordinator: AMTCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the siren sensor."""
-        super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_siren"
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if siren is active."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get(DATA_SIREN, False)
-
-
-class AMTProblemSensor(AMTBinarySensorBase):
-    """Problem sensor."""
-
-    _attr_device_class = BinarySensorDeviceClass.PROBLEM
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_name = "Problema"
-
-    def __init__(
-        self,
-        coordinator: AMTCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the problem sensor."""
-        super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_problem"
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if there is a problem."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get(DATA_PROBLEM, False)
-
-
-class AMTBatteryLowSensor(AMTBinarySensorBase):
-    """Battery low sensor."""
-
-    _attr_device_class = BinarySensorDeviceClass.BATTERY
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_name = "Bateria Fraca"
-
-    def __init__(
-        self,
-        coordinator: AMTCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the battery low sensor."""
-        super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_battery_low"
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if battery is low."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get(DATA_BATTERY_LOW, False)
-
-
-class AMTBatteryAbsentSensor(AMTBinarySensorBase):
-    """Battery absent sensor."""
-
-    _attr_device_class = BinarySensorDeviceClass.PROBLEM
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_name = "Bateria Ausente"
-
-    def __init__(
-        self,
-        coordinator: AMTCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the battery absent sensor."""
-        super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_battery_absent"
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if battery is absent."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get(DATA_BATTERY_ABSENT, False)
-
-
-class AMTBatteryShortSensor(AMTBinarySensorBase):
-    """Battery short-circuit sensor."""
-
-    _attr_device_class = BinarySensorDeviceClass.PROBLEM
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_name = "Bateria em Curto"
-
-    def __init__(
-        self,
-        coordinator: AMTCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the battery short sensor."""
-        super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_battery_short"
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if battery has short-circuit."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get(DATA_BATTERY_SHORT, False)
-
-
-class AMTAuxOverloadSensor(AMTBinarySensorBase):
-    """Auxiliary output overload sensor."""
-
-    _attr_device_class = BinarySensorDeviceClass.PROBLEM
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_name = "Sobrecarga Aux"
-
-    def __init__(
-        self,
-        coordinator: AMTCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the aux overload sensor."""
-        super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_aux_overload"
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if aux output is overloaded."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get(DATA_AUX_OVERLOAD, False)
-
-
-class AMTSirenWireCutSensor(AMTBinarySensorBase):
-    """Siren wire cut sensor."""
-
-    _attr_device_class = BinarySensorDeviceClass.PROBLEM
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_name = "Fio Sirene Cortado"
-
-    def __init__(
-        self,
-        coordinator: AMTCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the siren wire cut sensor."""
-        super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_siren_wire_cut"
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if siren wire is cut."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get(DATA_SIREN_WIRE_CUT, False)
-
-
-class AMTSirenShortSensor(AMTBinarySensorBase):
-    """Siren short-circuit sensor."""
-
-    _attr_device_class = BinarySensorDeviceClass.PROBLEM
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_name = "Sirene em Curto"
-
-    def __init__(
-        self,
-        coordinator: AMTCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the siren short sensor."""
-        super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_siren_short"
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if siren has short-circuit."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get(DATA_SIREN_SHORT, False)
-
-
-class AMTPhoneLineCutSensor(AMTBinarySensorBase):
-    """Phone line cut sensor."""
-
-    _attr_device_class = BinarySensorDeviceClass.PROBLEM
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_name = "Linha Telefonica Cortada"
-
-    def __init__(
-        self,
-        coordinator: AMTCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the phone line cut sensor."""
-        super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_phone_line_cut"
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if phone line is cut."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get(DATA_PHONE_LINE_CUT, False)
-
-
-class AMTCommFailureSensor(AMTBinarySensorBase):
-    """Communication failure sensor."""
-
-    _attr_device_class = BinarySensorDeviceClass.PROBLEM
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_name = "Falha de Comunicacao"
-
-    def __init__(
-        self,
-        coordinator: AMTCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the communication failure sensor."""
-        super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_comm_failure"
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if there is a communication failure."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get(DATA_COMM_FAILURE, False)
+        """Return True if the status flag is set."""
+        return self._value(self.entity_description.key, False)
@@ -3,7 +3,12 @@
 from __future__ import annotations
 
 import asyncio
+from itertools import chain
 import logging
+import random
+import socket
+import struct
+import time
 from typing import Any
 
 from .const import (
@@ -47,6 +52,9 @@ from .const import (
     MAX_ZONES_SHORT_CIRCUIT,
     MAX_ZONES_TAMPER,
     NACK_MESSAGES,
+    PARTITION_INDEX,
+    RECONNECT_BACKOFF_INITIAL,
+    RECONNECT_BACKOFF_MAX,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -66,6 +74,11 @@ CMD_ACK = 0xF0FE
 CMD_NACK = 0xF0FD
 CMD_BUSY = 0xF0F7
 
+# ISECNet2 packet framing: dst_id=0x0000, src_id=0x8FFF, then length/command
+_HDR_PREFIX = b"\x00\x00\x8f\xff"
+_PKT_LEN_CMD = struct.Struct(">HH")
+_BE16 = struct.Struct(">H")
+
 # AMT status payload offsets (zero-based, without protocol header)
 OFFSET_STATUS = 20
 OFFSET_PARTITIONS_START = 21
@@ -75,6 +88,14 @@ OFFSET_BYPASSED_ZONES_START = 54
 OFFSET_TAMPER_STATUS = 71
 OFFSET_BATTERY_STATUS = 134
 
+# Fixed status layout from OFFSET_STATUS: status byte, 4 partition bytes,
+# open/violated/bypassed zone bitmaps, tamper byte and battery byte.
+_STATUS_LAYOUT = struct.Struct(
+    f"<B4s{OFFSET_OPEN_ZONES_START - OFFSET_PARTITIONS_START - 4}x8s8s8s"
+    f"{OFFSET_TAMPER_STATUS - OFFSET_BYPASSED_ZONES_START - 8}xB"
+    f"{OFFSET_BATTERY_STATUS - OFFSET_TAMPER_STATUS - 1}xB"
+)
+
 # Panel status bit masks (payload[20])
 BIT_STATUS_PROBLEM = 0x01
 BIT_STATUS_SIREN = 0x02
@@ -98,11 +119,35 @@ BATTERY_LOW = 0x02
 BATTERY_MIDDLE = 0x03
 BATTERY_FULL = 0x04
 
+# Approximate battery percentage per battery code
+_BATTERY_LEVELS = {
+    BATTERY_DEAD: 5,
+    BATTERY_LOW: 25,
+    BATTERY_MIDDLE: 60,
+    BATTERY_FULL: 100,
+}
+
 # Alarm state (status byte bits 5..6)
 ALARM_DISARMED = 0x00
 ALARM_PARTIAL = 0x01
 ALARM_ALL = 0x03
 
+# Zone flags not decoded from ISECNet2 status yet; shared, never mutated.
+_NO_ZONES_TAMPER: tuple[bool, ...] = (False,) * MAX_ZONES_TAMPER
+_NO_ZONES_SHORT_CIRCUIT: tuple[bool, ...] = (False,) * MAX_ZONES_SHORT_CIRCUIT
+_NO_ZONES_LOW_BATTERY: tuple[bool, ...] = (False,) * MAX_ZONES_LOW_BATTERY
+
+# Bits of every byte value, least significant first (zone 1 is bit 0).
+_BYTE_BITS: tuple[tuple[bool, ...], ...] = tuple(
+    tuple(bool(value & (1 << bit)) for bit in range(8)) for value in range(256)
+)
+
+# Every byte value except ASCII digits, deleted when normalizing passwords.
+_NON_DIGITS = bytes(value for value in range(256) if not 0x30 <= value <= 0x39)
+
+# Contact-ID digit encoding for ASCII digits: "0" -> 0x0A, "1".."9" -> 1..9.
+_CONTACT_ID_TABLE = bytes.maketrans(b"0123456789", bytes([0x0A, *range(1, 10)]))
+
 MODEL_NAMES = {
     0x01: "AMT-8000",
     0x38: "AMT 1016",
@@ -147,7 +192,15 @@ class AMTClient:
         self._connected = False
         self._authenticated = False
         self._auth_password: str | None = None
+        # Encoded CMD_AUTH payloads keyed by password; switching between the
+        # main and partition passwords re-authenticates the socket.
+        self._auth_payloads: dict[str, bytes] = {}
         self._partition_passwords: dict[str, str] = {}
+        self._reconnect_delay = RECONNECT_BACKOFF_INITIAL
+        self._next_connect_at = 0.0
+        self._packets = self._prebuild_packets()
+        # Sent on every poll; bypasses the packet table lookup.
+        self._status_packet = self._packets[(CMD_STATUS, b"")]
 
     def set_partition_passwords(
         self,
@@ -157,49 +210,118 @@ class AMTClient:
         password_d: str | None = None,
     ) -> None:
         """Set partition passwords."""
-        if password_a:
-            self._partition_passwords["A"] = password_a
-        if password_b:
-            self._partition_passwords["B"] = password_b
-        if password_c:
-            self._partition_passwords["C"] = password_c
-        if password_d:
-            self._partition_passwords["D"] = password_d
+        self._partition_passwords.update(
+            (name, password)
+            for name, password in zip(
+                "ABCD", (password_a, password_b, password_c, password_d)
+            )
+            if password
+        )
 
     @property
     def connected(self) -> bool:
         """Return connection status."""
         return self._connected
 
+    @property
+    def reconnect_delay(self) -> float:
+        """Return the backoff applied after the next failed connect (seconds)."""
+        return self._reconnect_delay
+
+    @property
+    def reconnect_pending(self) -> bool:
+        """Return True while periodic polls should hold back reconnecting.
+
+        Only the coordinator's poll honours the backoff; connect() itself
+        always tries, so user commands reach a panel that is back online.
+        """
+        return not self._connected and time.monotonic() < self._next_connect_at
+
+    def _schedule_reconnect(self) -> None:
+        """Defer the next polled connect attempt using capped exponential backoff."""
+        # Jitter keeps several HA instances from retrying a panel in lockstep.
+        delay = self._reconnect_delay * random.uniform(0.5, 1.5)
+        self._next_connect_at = time.monotonic() + delay
+        self._reconnect_delay = min(self._reconnect_delay * 2, RECONNECT_BACKOFF_MAX)
+        _LOGGER.debug(
+            "Next connect to AMT at %s:%s in %.1fs", self._host, self._port, delay
+        )
+
+    def _reset_reconnect(self) -> None:
+        """Reset reconnect backoff after a successful session."""
+        self._reconnect_delay = RECONNECT_BACKOFF_INITIAL
+        self._next_connect_at = 0.0
+
     async def connect(self) -> None:
         """Connect to the AMT alarm panel."""
-        if self._connected and self._reader and self._writer:
+        writer = self._writer
+        if self._connected and self._reader and writer and not writer.is_closing():
             return
 
+        if writer is not None:
+            # Stale transport from a failed session; release its socket now
+            # instead of leaving it for the garbage collector.
+            writer.close()
+            self._reader = self._writer = None
+
         try:
-            self._reader, self._writer = await asyncio.wait_for(
-                asyncio.open_connection(self._host, self._port),
-                timeout=CONNECTION_TIMEOUT,
-            )
+            async with asyncio.timeout(CONNECTION_TIMEOUT):
+                self._reader, self._writer = await asyncio.open_connection(
+                    self._host, self._port
+                )
+            self._tune_socket()
             self._connected = True
             self._authenticated = False
             self._auth_password = None
             _LOGGER.debug("Connected to AMT at %s:%s", self._host, self._port)
         except asyncio.TimeoutError as err:
+            self._schedule_reconnect()
             raise AMTConnectionError(
                 f"Connection timeout to {self._host}:{self._port}"
             ) from err
         except OSError as err:
+            self._schedule_reconnect()
             raise AMTConnectionError(
                 f"Connection failed to {self._host}:{self._port}: {err}"
             ) from err
 
+    def _tune_socket(self) -> None:
+        """Apply socket options to the panel connection."""
+        assert self._writer is not None
+        sock = self._writer.get_extra_info("socket")
+        if sock is None:
+            return
+
+        # Commands are a few bytes each; never let Nagle hold them back.
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError as err:
+            _LOGGER.debug("Could not set TCP_NODELAY: %s", err)
+
+        # Detect a silently dropped panel link while the socket sits idle.
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        except OSError as err:
+            _LOGGER.debug("Could not set SO_KEEPALIVE: %s", err)
+
+        # Let the kernel give up on unacknowledged data after the same interval
+        # we wait for a response, instead of retransmitting for minutes.
+        if hasattr(socket, "TCP_USER_TIMEOUT"):
+            try:
+                sock.setsockopt(
+                    socket.IPPROTO_TCP,
+                    socket.TCP_USER_TIMEOUT,
+                    CONNECTION_TIMEOUT * 1000,
+                )
+            except OSError as err:
+                _LOGGER.debug("Could not set TCP_USER_TIMEOUT: %s", err)
+
     async def disconnect(self) -> None:
         """Disconnect from the AMT alarm panel."""
         if self._writer:
             try:
                 if self._authenticated:
-                    bye_packet = self._build_packet(CMD_BYE, b"")
+                    bye_packet = self._packets[(CMD_BYE, b"")]
                     self._writer.write(bye_packet)
                     await self._writer.drain()
             except Exception:  # noqa: BLE001
@@ -219,23 +341,28 @@ class AMTClient:
 
     def _checksum(self, data: bytes) -> int:
         """Calculate ISECNet2 checksum (xor all bytes then xor 0xFF)."""
+        # XOR is associative, so fold 8 bytes at a time as uint64 words and
+        # then fold the word's lanes down to one byte.
+        view = memoryview(data)
+        word_len = len(view) & ~7
         checksum = 0
-        for byte in data:
+        for word in view[:word_len].cast("Q"):
+            checksum ^= word
+        for byte in view[word_len:]:
             checksum ^= byte
-        checksum ^= 0xFF
-        return checksum & 0xFF
-
-    def _be16(self, value: int) -> bytes:
-        """Encode uint16 big-endian."""
-        return bytes([(value >> 8) & 0xFF, value & 0xFF])
-
-    def _from_be16(self, raw: bytes) -> int:
-        """Decode uint16 big-endian."""
-        return (raw[0] << 8) | raw[1]
+        checksum ^= checksum >> 32
+        checksum ^= checksum >> 16
+        checksum ^= checksum >> 8
+        return (checksum ^ 0xFF) & 0xFF
 
     def _normalize_password(self, password: str) -> str:
         """Normalize password to 4 or 6 digits for Contact-ID encoding."""
-        digits = "".join(ch for ch in password if ch.isdigit())
+        if password.isascii():
+            digits = (
+                password.encode("ascii").translate(None, _NON_DIGITS).decode("ascii")
+            )
+        else:
+            digits = "".join(ch for ch in password if ch.isdigit())
         if len(digits) in (4, 6):
             return digits
 
@@ -245,23 +372,46 @@ class AMTClient:
     def _encode_contact_id_digits(self, password: str) -> bytes:
         """Encode password as Contact-ID digits (0 -> 0x0A)."""
         normalized = self._normalize_password(password)
-        encoded = []
-        for ch in normalized:
-            digit = int(ch)
-            encoded.append(0x0A if digit == 0 else digit)
-        return bytes(encoded)
+        if normalized.isascii():
+            return normalized.encode("ascii").translate(_CONTACT_ID_TABLE)
+        # Non-ASCII Unicode digits still pass str.isdigit(); encode them one by one.
+        return bytes(int(ch) or 0x0A for ch in normalized)
+
+    def _prebuild_packets(self) -> dict[tuple[int, bytes], bytes]:
+        """Build the fixed status/control packets once, keyed by (command, payload)."""
+        requests: list[tuple[int, bytes]] = [
+            (CMD_STATUS, b""),
+            (CMD_BYE, b""),
+            (CMD_PANIC, bytes([0x01])),
+            (CMD_PANIC, bytes([0x00])),
+            (CMD_SIREN_OFF, bytes([0xFF])),
+        ]
+        # Arm/disarm/stay for all partitions (0xFF) and partitions 1..4
+        requests.extend(
+            (CMD_ARM_DISARM, bytes([target, mode]))
+            for target in (0xFF, 1, 2, 3, 4)
+            for mode in (0x00, 0x01, 0x02)
+        )
+        requests.extend(
+            (CMD_PGM, bytes([pgm_number, state]))
+            for pgm_number in range(1, MAX_PGMS + 1)
+            for state in (0x00, 0x01)
+        )
+        requests.extend(
+            (CMD_BYPASS_ZONE, bytes([zone_idx, 0x01]))
+            for zone_idx in range(MAX_ZONES_4010)
+        )
+        return {
+            (command, payload): self._build_packet(command, payload)
+            for command, payload in requests
+        }
 
     def _build_packet(self, command: int, payload: bytes) -> bytes:
         """Build ISECNet2 packet."""
-        # dst_id=0x0000, src_id=0x8FFF
         packet_no_checksum = (
-            self._be16(0x0000)
-            + self._be16(0x8FFF)
-            + self._be16(len(payload) + 2)
-            + self._be16(command)
-            + payload
+            _HDR_PREFIX + _PKT_LEN_CMD.pack(len(payload) + 2, command) + payload
         )
-        return packet_no_checksum + bytes([self._checksum(packet_no_checksum)])
+        return packet_no_checksum + bytes((self._checksum(packet_no_checksum),))
 
     async def _read_packet(self) -> tuple[int, bytes]:
         """Read exactly one ISECNet2 packet and return (cmd, payload)."""
@@ -269,15 +419,13 @@ class AMTClient:
             raise AMTConnectionError("Not connected")
 
         try:
-            header = await asyncio.wait_for(
-                self._reader.readexactly(6),
-                timeout=CONNECTION_TIMEOUT,
-            )
-            body_length = self._from_be16(header[4:6])
-            body = await asyncio.wait_for(
-                self._reader.readexactly(body_length + 1),
-                timeout=CONNECTION_TIMEOUT,
-            )
+            # StreamReader already reads ahead: back-to-back packets (ACK then
+            # status) land in its buffer from one recv and are served from there.
+            # One deadline for the whole packet rather than one timer per read.
+            async with asyncio.timeout(CONNECTION_TIMEOUT):
+                header = await self._reader.readexactly(6)
+                (body_length,) = _BE16.unpack_from(header, 4)
+                body = await self._reader.readexactly(body_length + 1)
         except asyncio.IncompleteReadError as err:
             raise AMTConnectionError("Connection closed by remote") from err
         except asyncio.TimeoutError as err:
@@ -285,11 +433,12 @@ class AMTClient:
         except OSError as err:
             raise AMTConnectionError(f"Communication error: {err}") from err
 
-        packet = header + body
-        if self._checksum(packet) != 0x00:
+        # A valid packet XORs to 0xFF overall; check both halves in place so the
+        # header and body are never concatenated just to be verified.
+        if self._checksum(header) ^ self._checksum(body) != 0xFF:
             raise AMTProtocolError("Invalid checksum in response")
 
-        command = self._from_be16(body[0:2])
+        (command,) = _BE16.unpack_from(body)
         payload = body[2:-1]
         return command, payload
 
@@ -298,12 +447,20 @@ class AMTClient:
         if not self._writer:
             raise AMTConnectionError("Not connected")
 
-        packet = self._build_packet(command, payload)
+        if command == CMD_STATUS and not payload:
+            packet = self._status_packet
+        else:
+            packet = self._packets.get((command, payload)) or self._build_packet(
+                command, payload
+            )
         _LOGGER.debug("Sending ISEC packet cmd=0x%04X payload=%s", command, payload.hex())
 
         try:
             self._writer.write(packet)
-            await self._writer.drain()
+            # Small packets normally go straight to the socket; only wait for
+            # flow control when the transport actually had to buffer them.
+            if self._writer.transport.get_write_buffer_size():
+                await self._writer.drain()
             response_command, response_payload = await self._read_packet()
             _LOGGER.debug(
                 "Received ISEC packet cmd=0x%04X payload=%s",
@@ -322,8 +479,11 @@ class AMTClient:
         if self._authenticated and self._auth_password == password:
             return
 
-        encoded_password = self._encode_contact_id_digits(password)
-        payload = bytes([0x02]) + encoded_password + bytes([0x10])
+        payload = self._auth_payloads.get(password)
+        if payload is None:
+            encoded_password = self._encode_contact_id_digits(password)
+            payload = bytes([0x02]) + encoded_password + bytes([0x10])
+            self._auth_payloads[password] = payload
 
         response_command, response_payload = await self._send_packet(CMD_AUTH, payload)
 
@@ -343,6 +503,7 @@ class AMTClient:
         if auth_result == 0:
             self._authenticated = True
             self._auth_password = password
+            self._reset_reconnect()
             return
 
         # Known Intelbras auth result codes
@@ -356,6 +517,9 @@ class AMTClient:
 
     async def _ensure_authenticated_locked(self, password: str) -> None:
         """Ensure connection and authentication are active for given password."""
+        if self._writer is None or self._writer.is_closing():
+            # The panel or the transport already closed the socket.
+            self._connected = False
         if not self._connected:
             await self.connect()
 
@@ -370,64 +534,72 @@ class AMTClient:
 
     async def _send_command(self, command: int, payload: bytes = b"", password: str | None = None) -> bytes:
         """Send an ISEC command and return payload."""
-        cmd_password = password or self._password
-
+        # One request in flight per connection: ACK/NACK/BUSY replies do not
+        # carry the request opcode, and authentication is per socket, so the
+        # lock must cover auth, write and read together.
         async with self._lock:
-            try:
-                await self._ensure_authenticated_locked(cmd_password)
-
-                response_command, response_payload = await self._send_packet(command, payload)
-
-                # Some commands may return ACK first and payload on the next packet.
-                for _ in range(2):
-                    if response_command == CMD_BUSY:
-                        raise AMTConnectionError("Central ocupada")
-
-                    if response_command == CMD_NACK:
-                        nack_code = response_payload[0] if response_payload else 0x00
-                        raise AMTNackError(nack_code)
-
-                    if response_command == command:
-                        return response_payload
-
-                    if response_command == CMD_ACK:
-                        # ACK is enough for control commands.
-                        if command != CMD_STATUS:
-                            return response_payload
-                        # Status should include full payload; keep waiting once.
-                        response_command, response_payload = await self._read_packet()
-                        continue
-
-                    raise AMTProtocolError(
-                        f"Unexpected response command: 0x{response_command:04X}"
-                    )
-
-                raise AMTProtocolError("No status payload received after ACK")
-
-            except (AMTConnectionError, AMTProtocolError, AMTNackError):
-                # Force fresh socket on next operation.
-                await self.disconnect()
-                raise
-
-    def _partition_number(self, partition: str) -> int:
-        """Map partition letter to protocol number."""
-        mapping = {"A": 1, "B": 2, "C": 3, "D": 4}
-        part = partition.upper().strip()
-        if part not in mapping:
+            return await self._send_command_locked(
+                command, payload, password or self._password
+            )
+
+    async def _send_command_locked(
+        self, command: int, payload: bytes, password: str
+    ) -> bytes:
+        """Send an ISEC command with the lock held and return payload."""
+        try:
+            await self._ensure_authenticated_locked(password)
+
+            response_command, response_payload = await self._send_packet(command, payload)
+
+            # Status may return ACK first and the payload on the next packet.
+            if response_command == CMD_ACK and command == CMD_STATUS:
+                response_command, response_payload = await self._read_packet()
+                if response_command == CMD_ACK:
+                    raise AMTProtocolError("No status payload received after ACK")
+
+            if response_command == CMD_BUSY:
+                raise AMTConnectionError("Central ocupada")
+
+            if response_command == CMD_NACK:
+                nack_code = response_payload[0] if response_payload else 0x00
+                raise AMTNackError(nack_code)
+
+            # ACK is enough for control commands.
+            if response_command in (command, CMD_ACK):
+                return response_payload
+
+            raise AMTProtocolError(
+                f"Unexpected response command: 0x{response_command:04X}"
+            )
+
+        except (AMTConnectionError, AMTProtocolError, AMTNackError):
+            # Force fresh socket on next operation.
+            await self.disconnect()
+            raise
+
+    def _partition_target(
+        self, partition: str, password: str | None
+    ) -> tuple[int, str]:
+        """Map a partition letter to its protocol number and password."""
+        part = partition.strip().upper()
+        partition_idx = PARTITION_INDEX.get(part)
+        if partition_idx is None:
             raise ValueError(f"Invalid partition: {partition}")
-        return mapping[part]
+        pwd = password or self._partition_passwords.get(part) or self._password
+        return partition_idx + 1, pwd
 
     def _parse_zone_bits(self, zone_bytes: bytes, max_zones: int) -> list[bool]:
         """Parse bit-packed zones to bool list."""
-        zones: list[bool] = [False] * max_zones
-        for byte_idx, byte in enumerate(zone_bytes):
-            for bit in range(8):
-                zone_idx = byte_idx * 8 + bit
-                if zone_idx >= max_zones:
-                    break
-                zones[zone_idx] = bool(byte & (1 << bit))
+        zones = list(chain.from_iterable(map(_BYTE_BITS.__getitem__, zone_bytes)))
+        del zones[max_zones:]
+        zones.extend([False] * (max_zones - len(zones)))
         return zones
 
+    def _count_zone_bits(self, zone_bytes: bytes, max_zones: int) -> int:
+        """Count set zone bits among the first max_zones zones."""
+        mask = (1 << max_zones) - 1
+        return (int.from_bytes(zone_bytes, "little") & mask).bit_count()
+
     def _parse_partition(self, part_byte: int, fallback_armed: bool = False, fallback_stay: bool = False, fallback_triggered: bool = False) -> dict[str, bool]:
         """Parse one partition status byte."""
         if not (part_byte & BIT_PART_ENABLED):
@@ -443,36 +615,46 @@ class AMTClient:
             "triggered": bool(part_byte & BIT_PART_TRIGGERED or part_byte & BIT_PART_ALARM_OCCURRED),
         }
 
-    def _parse_firmware(self, payload: bytes) -> str:
-        """Best-effort firmware parsing."""
-        # Some panels prepend one byte before model/version.
-        model_candidate = payload[0] if len(payload) > 0 else 0
-        if model_candidate in MODEL_NAMES and len(payload) >= 4:
-            return f"{payload[1]}.{payload[2]}.{payload[3]}"
-
-        if len(payload) >= 5:
-            return f"{payload[2]}.{payload[3]}.{payload[4]}"
-
-        return "unknown"
+    def _parse_model_firmware(self, payload: bytes) -> tuple[int, str, str]:
+        """Best-effort model and firmware parsing."""
+        model_id = payload[0] if payload else 0
+        if model_id in MODEL_NAMES:
+            firmware = (
+                f"{payload[1]}.{payload[2]}.{payload[3]}"
+                if len(payload) >= 4
+                else "unknown"
+            )
+            return model_id, MODEL_NAMES[model_id], firmware
 
-    def _parse_model(self, payload: bytes) -> tuple[int, str]:
-        """Best-effort model parsing."""
-        model_id = payload[0] if len(payload) > 0 else 0
-        if model_id not in MODEL_NAMES and len(payload) > 1 and payload[1] in MODEL_NAMES:
+        # Some panels prepend one byte before model/version.
+        if len(payload) > 1 and payload[1] in MODEL_NAMES:
             model_id = payload[1]
-
+        firmware = (
+            f"{payload[2]}.{payload[3]}.{payload[4]}" if len(payload) >= 5 else "unknown"
+        )
         model_name = MODEL_NAMES.get(model_id, f"Unknown (0x{model_id:02X})")
-        return model_id, model_name
+        return model_id, model_name, firmware
 
     def _parse_response(self, payload: bytes) -> dict[str, Any]:
         """Parse 0x0B4A status payload into coordinator data."""
         if len(payload) < OFFSET_STATUS + 1:
             raise AMTProtocolError(f"Status payload too short: {len(payload)} bytes")
 
-        model_id, model_name = self._parse_model(payload)
-        firmware = self._parse_firmware(payload)
-
-        status_byte = payload[OFFSET_STATUS]
+        model_id, model_name, firmware = self._parse_model_firmware(payload)
+
+        # Short payloads read as zeros past their end, like missing fields.
+        (
+            status_byte,
+            part_bytes,
+            open_bytes,
+            violated_bytes,
+            bypassed_bytes,
+            tamper_byte,
+            battery_code,
+        ) = _STATUS_LAYOUT.unpack_from(
+            payload.ljust(OFFSET_STATUS + _STATUS_LAYOUT.size, b"\x00"),
+            OFFSET_STATUS,
+        )
 
         armed_state = (status_byte >> 5) & 0x03
         armed = armed_state in (ALARM_PARTIAL, ALARM_ALL)
@@ -481,10 +663,6 @@ class AMTClient:
         siren = bool(status_byte & BIT_STATUS_SIREN)
         problem = bool(status_byte & BIT_STATUS_PROBLEM)
 
-        part_bytes = payload[OFFSET_PARTITIONS_START : OFFSET_PARTITIONS_START + 4]
-        while len(part_bytes) < 4:
-            part_bytes += b"\x00"
-
         partitions = {
             "A": self._parse_partition(part_bytes[0], armed, stay, triggered),
             "B": self._parse_partition(part_bytes[1]),
@@ -493,40 +671,18 @@ class AMTClient:
         }
 
         max_zones = MAX_ZONES_4010
-        zones_open = self._parse_zone_bits(
-            payload[OFFSET_OPEN_ZONES_START : OFFSET_OPEN_ZONES_START + 8],
-            max_zones,
-        )
-        zones_violated = self._parse_zone_bits(
-            payload[OFFSET_VIOLATED_ZONES_START : OFFSET_VIOLATED_ZONES_START + 8],
-            max_zones,
-        )
-        zones_bypassed = self._parse_zone_bits(
-            payload[OFFSET_BYPASSED_ZONES_START : OFFSET_BYPASSED_ZONES_START + 8],
-            max_zones,
-        )
+        zones_open = self._parse_zone_bits(open_bytes, max_zones)
+        zones_violated = self._parse_zone_bits(violated_bytes, max_zones)
+        zones_bypassed = self._parse_zone_bits(bypassed_bytes, max_zones)
 
-        zones_open_count = sum(zones_open)
-        zones_violated_count = sum(zones_violated)
-        zones_bypassed_count = sum(zones_bypassed)
+        zones_open_count = self._count_zone_bits(open_bytes, max_zones)
+        zones_violated_count = self._count_zone_bits(violated_bytes, max_zones)
+        zones_bypassed_count = self._count_zone_bits(bypassed_bytes, max_zones)
 
-        battery_code = payload[OFFSET_BATTERY_STATUS] if len(payload) > OFFSET_BATTERY_STATUS else 0
-        battery_level_map = {
-            BATTERY_DEAD: 5,
-            BATTERY_LOW: 25,
-            BATTERY_MIDDLE: 60,
-            BATTERY_FULL: 100,
-        }
-        battery_level = battery_level_map.get(battery_code, 0)
+        battery_level = _BATTERY_LEVELS.get(battery_code, 0)
         battery_low = battery_code in (BATTERY_DEAD, BATTERY_LOW)
 
-        tamper_flag = False
-        if len(payload) > OFFSET_TAMPER_STATUS:
-            tamper_flag = bool(payload[OFFSET_TAMPER_STATUS] & 0x02)
-
-        zones_tamper = [False] * MAX_ZONES_TAMPER
-        zones_short_circuit = [False] * MAX_ZONES_SHORT_CIRCUIT
-        zones_low_battery = [False] * MAX_ZONES_LOW_BATTERY
+        tamper_flag = bool(tamper_byte & 0x02)
 
         pgms = [False] * MAX_PGMS
 
@@ -539,9 +695,9 @@ class AMTClient:
             DATA_ZONES_OPEN: zones_open,
             DATA_ZONES_VIOLATED: zones_violated,
             DATA_ZONES_BYPASSED: zones_bypassed,
-            DATA_ZONES_TAMPER: zones_tamper,
-            DATA_ZONES_SHORT_CIRCUIT: zones_short_circuit,
-            DATA_ZONES_LOW_BATTERY: zones_low_battery,
+            DATA_ZONES_TAMPER: _NO_ZONES_TAMPER,
+            DATA_ZONES_SHORT_CIRCUIT: _NO_ZONES_SHORT_CIRCUIT,
+            DATA_ZONES_LOW_BATTERY: _NO_ZONES_LOW_BATTERY,
             DATA_ZONES_OPEN_COUNT: zones_open_count,
             DATA_ZONES_VIOLATED_COUNT: zones_violated_count,
             DATA_ZONES_BYPASSED_COUNT: zones_bypassed_count,
@@ -585,20 +741,17 @@ class AMTClient:
 
     async def arm_partition(self, partition: str, password: str | None = None) -> None:
         """Arm a specific partition."""
-        part_num = self._partition_number(partition)
-        pwd = password or self._partition_passwords.get(partition.upper()) or self._password
+        part_num, pwd = self._partition_target(partition, password)
         await self._send_command(CMD_ARM_DISARM, bytes([part_num, 0x01]), pwd)
 
     async def disarm_partition(self, partition: str, password: str | None = None) -> None:
         """Disarm a specific partition."""
-        part_num = self._partition_number(partition)
-        pwd = password or self._partition_passwords.get(partition.upper()) or self._password
+        part_num, pwd = self._partition_target(partition, password)
         await self._send_command(CMD_ARM_DISARM, bytes([part_num, 0x00]), pwd)
 
     async def arm_stay_partition(self, partition: str, password: str | None = None) -> None:
         """Arm a specific partition in stay mode."""
-        part_num = self._partition_number(partition)
-        pwd = password or self._partition_passwords.get(partition.upper()) or self._password
+        part_num, pwd = self._partition_target(partition, password)
         await self._send_command(CMD_ARM_DISARM, bytes([part_num, 0x02]), pwd)
 
     async def activate_pgm(self, pgm_number: int) -> None:
@@ -643,10 +796,16 @@ class AMTClient:
 
     async def bypass_zones(self, zone_mask: list[bool]) -> None:
         """Bypass zones according to mask."""
-        for zone_idx, enabled in enumerate(zone_mask, start=1):
-            if not enabled:
-                continue
-            await self._send_command(CMD_BYPASS_ZONE, bytes([zone_idx - 1, 0x01]))
+        zones = [zone_idx for zone_idx, enabled in enumerate(zone_mask) if enabled]
+        if not zones:
+            return
+
+        # One lock hold and one authentication for the whole batch.
+        async with self._lock:
+            for zone_idx in zones:
+                await self._send_command_locked(
+                    CMD_BYPASS_ZONE, bytes([zone_idx, 0x01]), self._password
+                )
 
     async def bypass_open_zones(self, open_zones: list[bool]) -> None:
         """Bypass all currently open zones."""
@@ -665,12 +824,16 @@ class AMTClient:
         - "0B 4A 01 02"
         """
         try:
-            clean = command_hex.replace(" ", "").replace("0x", "")
-            raw = bytes.fromhex(clean)
+            try:
+                # Plain hex (optionally space-separated) needs no cleanup pass.
+                raw = bytes.fromhex(command_hex)
+            except ValueError:
+                clean = command_hex.replace(" ", "").replace("0x", "")
+                raw = bytes.fromhex(clean)
             if len(raw) < 2:
                 return {"success": False, "error": "Command must be at least 2 bytes"}
 
-            command = (raw[0] << 8) | raw[1]
+            (command,) = _BE16.unpack_from(raw)
             payload = raw[2:]
         except ValueError:
             return {"success": False, "error": "Invalid hex command format"}
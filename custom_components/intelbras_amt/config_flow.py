@@ -13,7 +13,9 @@ from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 
 from .const import (
+    CONF_DISCOVER_ACTIVE_ZONES,
     CONF_SCAN_INTERVAL,
+    DEFAULT_DISCOVER_ACTIVE_ZONES,
     DEFAULT_PORT,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
@@ -32,6 +34,9 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
+# Options form validator; only the field defaults change between renders.
+SCAN_INTERVAL_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=1, max=60))
+
 
 class AMTConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Intelbras AMT."""
@@ -117,7 +122,13 @@ class AMTOptionsFlow(OptionsFlow):
                                 CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
                             ),
                         ),
-                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=60)),
+                    ): SCAN_INTERVAL_VALIDATOR,
+                    vol.Required(
+                        CONF_DISCOVER_ACTIVE_ZONES,
+                        default=self._config_entry.options.get(
+                            CONF_DISCOVER_ACTIVE_ZONES, DEFAULT_DISCOVER_ACTIVE_ZONES
+                        ),
+                    ): bool,
                 }
             ),
         )
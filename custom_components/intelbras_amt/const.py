@@ -8,8 +8,14 @@ DOMAIN: Final = "intelbras_amt"
 DEFAULT_PORT: Final = 9009
 DEFAULT_CONTROL_PORT: Final = 9019  # HTTP control port for CLI access
 DEFAULT_SCAN_INTERVAL: Final = 1  # seconds
+DEFAULT_DISCOVER_ACTIVE_ZONES: Final = False  # create every zone up front
 CONNECTION_TIMEOUT: Final = 5  # seconds
 RECONNECT_INTERVAL: Final = 10  # seconds
+RECONNECT_BACKOFF_INITIAL: Final = 1.0  # seconds, doubled per failed connect
+RECONNECT_BACKOFF_MAX: Final = 60.0  # seconds
+COMMAND_RETRY_ATTEMPTS: Final = 3  # arm/disarm attempts on connection drops
+COMMAND_RETRY_STEP: Final = 0.2  # seconds, linear backoff between attempts
+REQUEST_REFRESH_COOLDOWN: Final = 2.0  # seconds between command-triggered refreshes
 
 # Configuration keys
 CONF_HOST: Final = "host"
@@ -20,6 +26,7 @@ CONF_PASSWORD_B: Final = "password_b"
 CONF_PASSWORD_C: Final = "password_c"
 CONF_PASSWORD_D: Final = "password_d"
 CONF_SCAN_INTERVAL: Final = "scan_interval"
+CONF_DISCOVER_ACTIVE_ZONES: Final = "discover_only_active_zones"
 
 # Protocol constants
 FRAME_START: Final = 0xE9
@@ -131,10 +138,11 @@ MAX_ZONES_1016: Final = 16
 MAX_PARTITIONS: Final = 4
 MAX_PGMS: Final = 19  # Expanded from 3 to 19
 
-# Zone sensor limits
-MAX_ZONES_TAMPER: Final = 18
-MAX_ZONES_SHORT_CIRCUIT: Final = 18
-MAX_ZONES_LOW_BATTERY: Final = 40
+# Zone sensor limits. Each is also capped at the panel's zone count
+# (DATA_MAX_ZONES), e.g. an AMT 2018 gets at most 18 low-battery sensors.
+MAX_ZONES_TAMPER: Final = 18  # wired zones with tamper detection
+MAX_ZONES_SHORT_CIRCUIT: Final = 18  # wired zones with short-circuit detection
+MAX_ZONES_LOW_BATTERY: Final = 40  # wireless zones
 
 # Entity prefixes
 ENTITY_PREFIX: Final = "amt"
@@ -187,3 +195,4 @@ PARTITION_NAMES: Final = {
     2: "C",
     3: "D",
 }
+PARTITION_INDEX: Final = {name: idx for idx, name in PARTITION_NAMES.items()}
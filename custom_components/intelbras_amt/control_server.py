@@ -2,16 +2,96 @@
 
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
+from itertools import compress
 import logging
-from typing import Any
+from typing import Any, TypeVar
 
 from aiohttp import web
 
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.json import json_loads
+
 from .const import DEFAULT_CONTROL_PORT
 from .server import AMTServer
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Backend calls keyed by (partition given, stay) for /command/arm, taking
+# (server, partition, password). The backend may be an AMTServer or an
+# AMTClient, so each entry calls the method on the instance it is given.
+_ARM_METHODS: dict[
+    tuple[bool, bool], Callable[[AMTServer, str, str | None], Awaitable[None]]
+] = {
+    (False, False): lambda server, partition, password: server.arm(password),
+    (False, True): lambda server, partition, password: server.arm_stay(password),
+    (True, False): lambda server, partition, password: server.arm_partition(
+        partition, password
+    ),
+    (True, True): lambda server, partition, password: server.arm_stay_partition(
+        partition, password
+    ),
+}
+
+# Fixed reply bodies, encoded once (503 while no panel is connected, command OK).
+_STATUS_NOT_CONNECTED = json_bytes({"connected": False, "error": "No panel connected"})
+_COMMAND_NOT_CONNECTED = json_bytes({"success": False, "error": "No panel connected"})
+_COMMAND_OK = json_bytes({"success": True})
+# GET /connected replies, keyed by the backend's connected flag.
+_CONNECTED_BODIES: dict[bool, bytes] = {
+    connected: json_bytes({"connected": connected}) for connected in (False, True)
+}
+
+# Fixed 400 reply bodies for malformed requests.
+_INVALID_JSON_BODY = json_bytes({"success": False, "error": "Invalid JSON body"})
+_MISSING_COMMAND = json_bytes({"success": False, "error": "Missing 'command' field"})
+_INVALID_ACTION = json_bytes({"success": False, "error": "Action must be 'on' or 'off'"})
+_INVALID_PGM_NUMBER = json_bytes({"success": False, "error": "PGM number must be 1-19"})
+
+
+def _json_response(data: Any, status: int = 200) -> web.Response:
+    """Return a JSON response serialized with Home Assistant's orjson encoder."""
+    return _json_body_response(json_bytes(data), status)
+
+
+def _json_body_response(body: bytes, status: int) -> web.Response:
+    """Return a response for an already encoded JSON body."""
+    return web.Response(
+        body=body, status=status, content_type="application/json", charset="utf-8"
+    )
+
+
+# Status keys whose flag lists are reported as the numbers of the set entries.
+_ACTIVE_NUMBER_KEYS: frozenset[str] = frozenset(
+    (
+        "zones_open",
+        "zones_violated",
+        "zones_bypassed",
+        "zones_tamper",
+        "zones_short_circuit",
+        "zones_low_battery",
+        "pgms",
+    )
+)
+
+# Backend calls keyed by the request's "action" field.
+_SIREN_METHODS: dict[str, Callable[[AMTServer], Awaitable[None]]] = {
+    "on": lambda server: server.siren_on(),
+    "off": lambda server: server.siren_off(),
+}
+_PGM_METHODS: dict[str, Callable[[AMTServer, int], Awaitable[None]]] = {
+    "on": lambda server, number: server.activate_pgm(number),
+    "off": lambda server, number: server.deactivate_pgm(number),
+}
+
+
+def _action_method(methods: dict[str, _T], action: Any) -> _T | None:
+    """Return the backend call for an on/off action, or None if invalid."""
+    # JSON may carry unhashable values (lists, objects) in "action".
+    return methods.get(action) if isinstance(action, str) else None
+
 
 class AMTControlServer:
     """HTTP REST API server for controlling AMT panel via CLI."""
@@ -38,7 +118,13 @@ class AMTControlServer:
         self._app = web.Application()
         self._setup_routes()
 
-        self._runner = web.AppRunner(self._app)
+        # No per-request access logging: this is a local CLI endpoint and every
+        # command frame is already debug-logged by the AMT server. Idle
+        # keep-alive connections are held for 5 minutes (aiohttp default: 75s)
+        # so CLI loops polling /status reuse their connection.
+        self._runner = web.AppRunner(
+            self._app, access_log=None, keepalive_timeout=300
+        )
         await self._runner.setup()
         site = web.TCPSite(self._runner, "0.0.0.0", self._port)
         await site.start()
@@ -67,26 +153,25 @@ class AMTControlServer:
     async def _handle_status(self, request: web.Request) -> web.Response:
         """GET /status - Get current panel status."""
         if not self._amt_server.connected:
-            return web.json_response(
-                {"connected": False, "error": "No panel connected"},
-                status=503,
-            )
+            return _json_body_response(_STATUS_NOT_CONNECTED, 503)
 
         try:
             status = await self._amt_server.get_status()
             # Convert non-JSON-serializable types
             status_json = self._status_to_json(status)
-            return web.json_response({"connected": True, "status": status_json})
+            return _json_response({"connected": True, "status": status_json})
         except Exception as e:
             _LOGGER.error("Error getting status: %s", e)
-            return web.json_response(
+            return _json_response(
                 {"connected": True, "error": str(e)},
                 status=500,
             )
 
     async def _handle_connected(self, request: web.Request) -> web.Response:
         """GET /connected - Check if panel is connected."""
-        return web.json_response({"connected": self._amt_server.connected})
+        return _json_body_response(
+            _CONNECTED_BODIES[bool(self._amt_server.connected)], 200
+        )
 
     async def _handle_raw_command(self, request: web.Request) -> web.Response:
         """POST /command/raw - Send raw hex command.
@@ -94,30 +179,21 @@ class AMTControlServer:
         Body: {"command": "41 35", "password": "1234"}
         """
         if not self._amt_server.connected:
-            return web.json_response(
-                {"success": False, "error": "No panel connected"},
-                status=503,
-            )
+            return _json_body_response(_COMMAND_NOT_CONNECTED, 503)
 
         try:
-            data = await request.json()
+            data = json_loads(await request.read())
         except Exception:
-            return web.json_response(
-                {"success": False, "error": "Invalid JSON body"},
-                status=400,
-            )
+            return _json_body_response(_INVALID_JSON_BODY, 400)
 
         command = data.get("command")
         if not command:
-            return web.json_response(
-                {"success": False, "error": "Missing 'command' field"},
-                status=400,
-            )
+            return _json_body_response(_MISSING_COMMAND, 400)
 
         password = data.get("password")
         result = await self._amt_server.send_raw_command(command, password)
         status_code = 200 if result.get("success") else 400
-        return web.json_response(result, status=status_code)
+        return _json_response(result, status=status_code)
 
     async def _handle_arm(self, request: web.Request) -> web.Response:
         """POST /command/arm - Arm panel/partition.
@@ -125,40 +201,26 @@ class AMTControlServer:
         Body: {"partition": "A", "stay": false, "password": "1234"}
         """
         if not self._amt_server.connected:
-            return web.json_response(
-                {"success": False, "error": "No panel connected"},
-                status=503,
-            )
+            return _json_body_response(_COMMAND_NOT_CONNECTED, 503)
 
         try:
-            data = await request.json()
+            data = json_loads(await request.read())
         except Exception:
-            return web.json_response(
-                {"success": False, "error": "Invalid JSON body"},
-                status=400,
-            )
+            return _json_body_response(_INVALID_JSON_BODY, 400)
 
         partition = data.get("partition")
         stay = data.get("stay", False)
         password = data.get("password")
 
         try:
-            if partition:
-                # Arm specific partition
-                if stay:
-                    await self._amt_server.arm_stay_partition(partition.upper(), password)
-                else:
-                    await self._amt_server.arm_partition(partition.upper(), password)
-            else:
-                # Arm main panel
-                if stay:
-                    await self._amt_server.arm_stay(password)
-                else:
-                    await self._amt_server.arm(password)
+            # Arm a specific partition, or the main panel without one.
+            await _ARM_METHODS[bool(partition), bool(stay)](
+                self._amt_server, partition.upper() if partition else "", password
+            )
 
-            return web.json_response({"success": True})
+            return _json_body_response(_COMMAND_OK, 200)
         except Exception as e:
-            return web.json_response(
+            return _json_response(
                 {"success": False, "error": str(e)},
                 status=400,
             )
@@ -169,18 +231,12 @@ class AMTControlServer:
         Body: {"partition": "A", "password": "1234"}
         """
         if not self._amt_server.connected:
-            return web.json_response(
-                {"success": False, "error": "No panel connected"},
-                status=503,
-            )
+            return _json_body_response(_COMMAND_NOT_CONNECTED, 503)
 
         try:
-            data = await request.json()
+            data = json_loads(await request.read())
         except Exception:
-            return web.json_response(
-                {"success": False, "error": "Invalid JSON body"},
-                status=400,
-            )
+            return _json_body_response(_INVALID_JSON_BODY, 400)
 
         partition = data.get("partition")
         password = data.get("password")
@@ -191,9 +247,9 @@ class AMTControlServer:
             else:
                 await self._amt_server.disarm(password)
 
-            return web.json_response({"success": True})
+            return _json_body_response(_COMMAND_OK, 200)
         except Exception as e:
-            return web.json_response(
+            return _json_response(
                 {"success": False, "error": str(e)},
                 status=400,
             )
@@ -204,13 +260,10 @@ class AMTControlServer:
         Body: {"password": "1234"}
         """
         if not self._amt_server.connected:
-            return web.json_response(
-                {"success": False, "error": "No panel connected"},
-                status=503,
-            )
+            return _json_body_response(_COMMAND_NOT_CONNECTED, 503)
 
         try:
-            data = await request.json()
+            data = json_loads(await request.read())
         except Exception:
             data = {}
 
@@ -218,9 +271,9 @@ class AMTControlServer:
 
         try:
             await self._amt_server.arm_stay(password)
-            return web.json_response({"success": True})
+            return _json_body_response(_COMMAND_OK, 200)
         except Exception as e:
-            return web.json_response(
+            return _json_response(
                 {"success": False, "error": str(e)},
                 status=400,
             )
@@ -231,35 +284,23 @@ class AMTControlServer:
         Body: {"action": "on" | "off"}
         """
         if not self._amt_server.connected:
-            return web.json_response(
-                {"success": False, "error": "No panel connected"},
-                status=503,
-            )
+            return _json_body_response(_COMMAND_NOT_CONNECTED, 503)
 
         try:
-            data = await request.json()
+            data = json_loads(await request.read())
         except Exception:
-            return web.json_response(
-                {"success": False, "error": "Invalid JSON body"},
-                status=400,
-            )
+            return _json_body_response(_INVALID_JSON_BODY, 400)
 
-        action = data.get("action")
-        if action not in ("on", "off"):
-            return web.json_response(
-                {"success": False, "error": "Action must be 'on' or 'off'"},
-                status=400,
-            )
+        method = _action_method(_SIREN_METHODS, data.get("action"))
+        if method is None:
+            return _json_body_response(_INVALID_ACTION, 400)
 
         try:
-            if action == "on":
-                await self._amt_server.siren_on()
-            else:
-                await self._amt_server.siren_off()
+            await method(self._amt_server)
 
-            return web.json_response({"success": True})
+            return _json_body_response(_COMMAND_OK, 200)
         except Exception as e:
-            return web.json_response(
+            return _json_response(
                 {"success": False, "error": str(e)},
                 status=400,
             )
@@ -270,64 +311,40 @@ class AMTControlServer:
         Body: {"number": 1, "action": "on" | "off"}
         """
         if not self._amt_server.connected:
-            return web.json_response(
-                {"success": False, "error": "No panel connected"},
-                status=503,
-            )
+            return _json_body_response(_COMMAND_NOT_CONNECTED, 503)
 
         try:
-            data = await request.json()
+            data = json_loads(await request.read())
         except Exception:
-            return web.json_response(
-                {"success": False, "error": "Invalid JSON body"},
-                status=400,
-            )
+            return _json_body_response(_INVALID_JSON_BODY, 400)
 
         number = data.get("number")
-        action = data.get("action")
+        method = _action_method(_PGM_METHODS, data.get("action"))
 
         if not isinstance(number, int) or number < 1 or number > 19:
-            return web.json_response(
-                {"success": False, "error": "PGM number must be 1-19"},
-                status=400,
-            )
+            return _json_body_response(_INVALID_PGM_NUMBER, 400)
 
-        if action not in ("on", "off"):
-            return web.json_response(
-                {"success": False, "error": "Action must be 'on' or 'off'"},
-                status=400,
-            )
+        if method is None:
+            return _json_body_response(_INVALID_ACTION, 400)
 
         try:
-            if action == "on":
-                await self._amt_server.activate_pgm(number)
-            else:
-                await self._amt_server.deactivate_pgm(number)
+            await method(self._amt_server, number)
 
-            return web.json_response({"success": True})
+            return _json_body_response(_COMMAND_OK, 200)
         except Exception as e:
-            return web.json_response(
+            return _json_response(
                 {"success": False, "error": str(e)},
                 status=400,
             )
 
     def _status_to_json(self, status: dict[str, Any]) -> dict[str, Any]:
         """Convert status dict to JSON-serializable format."""
-        result = {}
-        for key, value in status.items():
-            if isinstance(value, list):
-                # Convert lists (zones, PGMs) - include only active ones for compactness
-                if key in ("zones_open", "zones_violated", "zones_bypassed",
-                          "zones_tamper", "zones_short_circuit", "zones_low_battery"):
-                    # Return list of zone numbers that are True
-                    result[key] = [i + 1 for i, v in enumerate(value) if v]
-                elif key == "pgms":
-                    # Return list of PGM numbers that are True
-                    result[key] = [i + 1 for i, v in enumerate(value) if v]
-                else:
-                    result[key] = value
-            elif isinstance(value, dict):
-                result[key] = value
-            else:
-                result[key] = value
+        # Everything except zone/PGM flag lists is passed through unchanged.
+        result = dict(status)
+        for key in _ACTIVE_NUMBER_KEYS.intersection(status):
+            value = status[key]
+            if isinstance(value, (list, tuple)):
+                # Include only active ones for compactness: list of zone/PGM
+                # numbers that are True
+                result[key] = list(compress(range(1, len(value) + 1), value))
         return result
@@ -2,26 +2,67 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from datetime import timedelta
+from functools import partial
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .client import AMTClientError, AMTNackError
-from .server import AMTServerError
+from .client import (
+    AMTClientError,
+    AMTConnectionError as AMTClientConnectionError,
+    AMTNackError,
+)
+from .server import AMTConnectionError as AMTServerConnectionError, AMTServerError
 from .const import (
+    COMMAND_RETRY_ATTEMPTS,
+    COMMAND_RETRY_STEP,
     DATA_CONNECTED,
+    DATA_PARTITIONS,
+    DATA_PGMS,
+    DATA_ZONES_BYPASSED,
+    DATA_ZONES_LOW_BATTERY,
     DATA_ZONES_OPEN,
-    DATA_ZONES_OPEN,
+    DATA_ZONES_SHORT_CIRCUIT,
+    DATA_ZONES_TAMPER,
+    DATA_ZONES_VIOLATED,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    MAX_PARTITIONS,
+    PARTITION_NAMES,
+    RECONNECT_INTERVAL,
+    REQUEST_REFRESH_COOLDOWN,
 )
 
+if TYPE_CHECKING:
+    from .control_server import AMTControlServer
+
 _LOGGER = logging.getLogger(__name__)
 
+# Per-zone flag lists snapshotted into tuples on every successful update.
+_ZONE_FLAG_KEYS: tuple[str, ...] = (
+    DATA_ZONES_OPEN,
+    DATA_ZONES_VIOLATED,
+    DATA_ZONES_BYPASSED,
+    DATA_ZONES_TAMPER,
+    DATA_ZONES_SHORT_CIRCUIT,
+    DATA_ZONES_LOW_BATTERY,
+)
+
+# Partition flags before the first status: every partition disarmed.
+_NO_PARTITION_FLAGS: tuple[bool, ...] = (False,) * MAX_PARTITIONS
+
+# Sentinel for keys missing from one side of a data diff.
+_MISSING = object()
+
 
 class AMTCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator for AMT alarm panel data."""
@@ -51,50 +92,232 @@ class AMTCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         hass: HomeAssistant,
         backend: Any,
         scan_interval: int = DEFAULT_SCAN_INTERVAL,
+        *,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the coordinator."""
+        # Client mode has connect/disconnect methods and no server lifecycle methods.
+        self._is_client_mode = hasattr(backend, "connect") and not hasattr(backend, "start")
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=scan_interval),
+            # The backend mode never changes, so pick its poll routine once.
+            update_method=(
+                self._async_update_client
+                if self._is_client_mode
+                else self._async_update_server
+            ),
+            # Listeners are only notified when the status actually changes
+            # (or the update succeeds/fails after the opposite outcome).
+            always_update=False,
+            # Back-to-back commands refresh right away, then at most once per
+            # cooldown (Home Assistant's default cooldown is 10s).
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=REQUEST_REFRESH_COOLDOWN, immediate=True
+            ),
         )
         self.backend = backend
+        # Panel device shared by every entity of the entry; its model is kept
+        # current by the listener registered in async_setup_entry.
+        self.device_info = device_info
+        self._scan_interval = self.update_interval
+        # Server mode waits for the panel to dial in; poll slower meanwhile.
+        self._waiting_interval = max(
+            self._scan_interval, timedelta(seconds=RECONNECT_INTERVAL)
+        )
         self._last_data: dict[str, Any] = {DATA_CONNECTED: False}
-        # Client mode has connect/disconnect methods and no server lifecycle methods.
-        self._is_client_mode = hasattr(backend, "connect") and not hasattr(backend, "start")
+        # Mirror of data[DATA_CONNECTED] so entity availability is an attribute read.
+        self.connected = False
+        # Zone flag tuples keyed by data key, rebuilt once per status update so
+        # zone entities index a tuple instead of walking coordinator.data.
+        self.zone_flags: dict[str, tuple[bool, ...]] = {}
+        # Partition flags indexed like PARTITION_NAMES, rebuilt with zone_flags.
+        self.partitions_armed: tuple[bool, ...] = _NO_PARTITION_FLAGS
+        self.partitions_stay: tuple[bool, ...] = _NO_PARTITION_FLAGS
+        self.partitions_triggered: tuple[bool, ...] = _NO_PARTITION_FLAGS
+        # PGM outputs as a bitmask, bit N-1 set while PGM N is on, and the
+        # number of PGMs the panel reported (higher PGMs are unknown).
+        self.pgm_mask = 0
+        self.pgm_count = 0
+        # Data keys whose value differs from the previously published data.
+        self.changed_keys: frozenset[str] = frozenset()
+        self._published: dict[str, Any] | None = None
+        # Optional backend capabilities; the backend is fixed for our lifetime.
+        self._has_stop = hasattr(backend, "stop")
+        self._has_disconnect = hasattr(backend, "disconnect")
+        self._has_arm_stay_partition = hasattr(backend, "arm_stay_partition")
+        # Status read shared by overlapping refreshes (periodic + command-triggered).
+        self._status_request: asyncio.Future[dict[str, Any]] | None = None
+
+    @property
+    def available(self) -> bool:
+        """Return True while entities should be available.
+
+        Shared by every platform: the last update must have succeeded (any
+        exception clears last_update_success but leaves data untouched) and
+        the panel must be connected.
+        """
+        return self.last_update_success and self.connected
+
+    @property
+    def reconnect_delay(self) -> float | None:
+        """Return the client reconnect backoff in seconds (client mode only)."""
+        if not self._is_client_mode:
+            return None
+        return self.backend.reconnect_delay
+
+    def _disconnected_data(self) -> dict[str, Any]:
+        """Return the last known data flagged as disconnected.
+
+        A new dict is swapped in rather than mutating the one entities may be
+        reading; it is reused while the panel stays disconnected.
+        """
+        self.connected = False
+        if self._last_data.get(DATA_CONNECTED, False):
+            self._last_data = {**self._last_data, DATA_CONNECTED: False}
+        return self._last_data
+
+    def _snapshot_partitions(self, data: dict[str, Any]) -> None:
+        """Split the per-partition dicts into tuples indexed by partition."""
+        partitions = data.get(DATA_PARTITIONS) or {}
+        rows = [
+            partitions.get(PARTITION_NAMES[partition_idx], {})
+            for partition_idx in range(MAX_PARTITIONS)
+        ]
+        self.partitions_armed = tuple(bool(row.get("armed", False)) for row in rows)
+        self.partitions_stay = tuple(bool(row.get("stay", False)) for row in rows)
+        self.partitions_triggered = tuple(
+            bool(row.get("triggered", False)) for row in rows
+        )
+
+    def _track_changes(self, data: dict[str, Any]) -> None:
+        """Record which keys differ from the previously published data."""
+        previous = self._published
+        self._published = data
+        if data is previous:
+            self.changed_keys = frozenset()
+        elif previous is None:
+            self.changed_keys = frozenset(data)
+        else:
+            self.changed_keys = frozenset(
+                key
+                for key in data.keys() | previous.keys()
+                if data.get(key, _MISSING) != previous.get(key, _MISSING)
+            )
 
     async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from AMT alarm panel."""
-        try:
-            if not self.backend.connected and not self._is_client_mode:
-                _LOGGER.debug("Panel not connected, waiting for connection...")
-                # Return last known data with connected=False
-                self._last_data[DATA_CONNECTED] = False
-                return self._last_data
+        """Fetch data through the mode's update method and diff it."""
+        data = await super()._async_update_data()
+        self._track_changes(data)
+        return data
+
+    async def _async_get_status(self) -> dict[str, Any]:
+        """Return backend status, joining a status read already in flight.
+
+        The backend serializes commands, so a refresh that starts while another
+        is reading status would otherwise queue a second identical read.
+        """
+        if self._status_request is None:
+            self._status_request = asyncio.ensure_future(self.backend.get_status())
+            self._status_request.add_done_callback(self._status_request_done)
+        # Shielded so one cancelled refresh does not cancel the shared read.
+        return await asyncio.shield(self._status_request)
+
+    def _status_request_done(self, request: asyncio.Future[dict[str, Any]]) -> None:
+        """Forget the finished status read."""
+        self._status_request = None
+        if not request.cancelled():
+            # Mark the error retrieved even if every waiter was cancelled.
+            request.exception()
 
-            # In client mode, get_status() will initiate the TCP connection when needed.
-            data = await self.backend.get_status()
-            self._last_data = data
-            return data
+    async def _async_update_server(self) -> dict[str, Any]:
+        """Fetch data in server mode, once the panel has dialed in."""
+        if not self.backend.connected:
+            _LOGGER.debug("Panel not connected, waiting for connection...")
+            self.update_interval = self._waiting_interval
+            # Return last known data with connected=False
+            return self._disconnected_data()
+
+        return await self._async_fetch_status()
+
+    async def _async_update_client(self) -> dict[str, Any]:
+        """Fetch data in client mode unless reconnect backoff is active."""
+        if self.backend.reconnect_pending:
+            _LOGGER.debug(
+                "Reconnect backoff active (next delay %.1fs), skipping poll",
+                self.backend.reconnect_delay,
+            )
+            return self._disconnected_data()
 
+        # get_status() will initiate the TCP connection when needed.
+        return await self._async_fetch_status()
+
+    async def _async_fetch_status(self) -> dict[str, Any]:
+        """Fetch data from AMT alarm panel."""
+        try:
+            data = await self._async_get_status()
         except (AMTServerError, AMTClientError) as err:
             _LOGGER.warning("Error communicating with AMT: %s", err)
-            # Return last known data with connected=False
-            self._last_data[DATA_CONNECTED] = False
+            # Publish last known data with connected=False; HA keeps the
+            # previous data untouched when UpdateFailed is raised.
+            self.data = self._disconnected_data()
+            self._track_changes(self.data)
             raise UpdateFailed(f"Error communicating with AMT: {err}") from err
 
+        self.update_interval = self._scan_interval
+        self._last_data = data
+        self.connected = bool(data.get(DATA_CONNECTED, False))
+        self.zone_flags = {
+            key: tuple(data.get(key) or ()) for key in _ZONE_FLAG_KEYS
+        }
+        self._snapshot_partitions(data)
+        pgms = data.get(DATA_PGMS) or ()
+        self.pgm_mask = sum(
+            1 << pgm_idx for pgm_idx, active in enumerate(pgms) if active
+        )
+        self.pgm_count = len(pgms)
+        return data
+
     async def async_shutdown(self) -> None:
         """Shutdown the coordinator."""
-        if hasattr(self.backend, "stop"):
+        if self._has_stop:
             await self.backend.stop()
-        elif hasattr(self.backend, "disconnect"):
+        elif self._has_disconnect:
             await self.backend.disconnect()
 
+    async def _async_send_arm_command(
+        self, send: Callable[[], Awaitable[None]]
+    ) -> None:
+        """Send an arm/disarm command, retrying connection errors.
+
+        Arm and disarm set an absolute state, so repeating them after a lost
+        reply is safe. Retried errors are failed connects, dropped or timed
+        out replies and a busy panel ("Central ocupada"). Every attempt dials
+        the panel regardless of the client's reconnect backoff, which only
+        holds back periodic polls. Retries use a short linear backoff; NACKs
+        and other panel-side rejections are never retried.
+        """
+        for attempt in range(1, COMMAND_RETRY_ATTEMPTS + 1):
+            try:
+                await send()
+                return
+            except (AMTClientConnectionError, AMTServerConnectionError) as err:
+                if attempt == COMMAND_RETRY_ATTEMPTS:
+                    raise
+                _LOGGER.debug(
+                    "Command attempt %s/%s failed: %s",
+                    attempt,
+                    COMMAND_RETRY_ATTEMPTS,
+                    err,
+                )
+                await asyncio.sleep(COMMAND_RETRY_STEP * attempt)
+
     async def async_arm(self, code: str | None = None) -> None:
         """Arm the alarm panel."""
         try:
-            await self.backend.arm(code)
+            await self._async_send_arm_command(partial(self.backend.arm, code))
             await self.async_request_refresh()
         except Exception as err:  # noqa: BLE001
             self._raise_control_error(err)
@@ -102,7 +325,7 @@ class AMTCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     async def async_disarm(self, code: str | None = None) -> None:
         """Disarm the alarm panel."""
         try:
-            await self.backend.disarm(code)
+            await self._async_send_arm_command(partial(self.backend.disarm, code))
             await self.async_request_refresh()
         except Exception as err:  # noqa: BLE001
             self._raise_control_error(err)
@@ -110,7 +333,7 @@ class AMTCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     async def async_arm_stay(self, code: str | None = None) -> None:
         """Arm in stay mode."""
         try:
-            await self.backend.arm_stay(code)
+            await self._async_send_arm_command(partial(self.backend.arm_stay, code))
             await self.async_request_refresh()
         except Exception as err:  # noqa: BLE001
             self._raise_control_error(err)
@@ -118,7 +341,9 @@ class AMTCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     async def async_arm_partition(self, partition: str, code: str | None = None) -> None:
         """Arm a specific partition."""
         try:
-            await self.backend.arm_partition(partition, code)
+            await self._async_send_arm_command(
+                partial(self.backend.arm_partition, partition, code)
+            )
             await self.async_request_refresh()
         except Exception as err:  # noqa: BLE001
             self._raise_control_error(err)
@@ -126,10 +351,11 @@ class AMTCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     async def async_arm_stay_partition(self, partition: str, code: str | None = None) -> None:
         """Arm a specific partition in stay mode."""
         try:
-            if hasattr(self.backend, "arm_stay_partition"):
-                await self.backend.arm_stay_partition(partition, code)
+            if self._has_arm_stay_partition:
+                send = partial(self.backend.arm_stay_partition, partition, code)
             else:
-                await self.backend.arm_partition(partition, code)
+                send = partial(self.backend.arm_partition, partition, code)
+            await self._async_send_arm_command(send)
             await self.async_request_refresh()
         except Exception as err:  # noqa: BLE001
             self._raise_control_error(err)
@@ -137,7 +363,9 @@ class AMTCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     async def async_disarm_partition(self, partition: str, code: str | None = None) -> None:
         """Disarm a specific partition."""
         try:
-            await self.backend.disarm_partition(partition, code)
+            await self._async_send_arm_command(
+                partial(self.backend.disarm_partition, partition, code)
+            )
             await self.async_request_refresh()
         except Exception as err:  # noqa: BLE001
             self._raise_control_error(err)
@@ -168,3 +396,12 @@ class AMTCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Turn siren off."""
         await self.backend.siren_off()
         await self.async_request_refresh()
+
+
+@dataclass(slots=True)
+class AMTEntryData:
+    """Runtime objects stored per config entry in hass.data."""
+
+    coordinator: AMTCoordinator
+    control_server: AMTControlServer
+    backend: Any
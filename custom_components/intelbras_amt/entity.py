@@ -0,0 +1,89 @@
+"""Shared entity base for Intelbras AMT integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DATA_CONNECTED
+from .coordinator import AMTCoordinator
+
+
+class AMTValueEntity(CoordinatorEntity[AMTCoordinator]):
+    """Coordinator entity whose state is one value read from coordinator data.
+
+    Availability and the value are resolved once per coordinator update and
+    cached in _attr_available and the _attr_* slot named by _value_attr.
+    Platform bases combine this with their entity class and set _value_attr.
+    """
+
+    __slots__ = ("_entry", "_state_snapshot")
+
+    _attr_has_entity_name = True
+    # Entity attribute the value is cached in (e.g. "_attr_is_on").
+    _value_attr: str
+    # Data keys the state depends on; updates that change none of them are
+    # skipped without recomputing the state.
+    _tracked_keys: frozenset[str] = frozenset((DATA_CONNECTED,))
+    # Data key (and default when absent) the value is read from.
+    _value_key: str
+    _value_default: Any = None
+
+    def __init__(
+        self,
+        coordinator: AMTCoordinator,
+        entry: ConfigEntry,
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._entry = entry
+        self._state_snapshot: tuple[bool, Any] | None = None
+        self._attr_device_info = coordinator.device_info
+
+    async def async_added_to_hass(self) -> None:
+        """Resolve the initial state before the first state write."""
+        await super().async_added_to_hass()
+        self._store_state(self._coordinator_state())
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when availability or value changed."""
+        coordinator = self.coordinator
+        # A failed update flips availability without publishing new data.
+        if (
+            self._state_snapshot is not None
+            and self._attr_available == coordinator.available
+            and self._tracked_keys.isdisjoint(coordinator.changed_keys)
+        ):
+            return
+        snapshot = self._coordinator_state()
+        if snapshot == self._state_snapshot:
+            return
+        self._state_snapshot = snapshot
+        self._store_state(snapshot)
+        super()._handle_coordinator_update()
+
+    @property
+    def available(self) -> bool:
+        """Return True if entity is available (cached per coordinator update)."""
+        # CoordinatorEntity overrides Entity.available, so read the cache here.
+        return self._attr_available
+
+    def _store_state(self, state: tuple[bool, Any]) -> None:
+        """Cache (available, value) in the entity's _attr_* attributes."""
+        self._attr_available, value = state
+        setattr(self, self._value_attr, value)
+
+    def _coordinator_state(self) -> tuple[bool, Any]:
+        """Return (available, value) from the latest coordinator data."""
+        return self.coordinator.available, self._coordinator_value()
+
+    def _coordinator_value(self) -> Any:
+        """Return the value from the latest coordinator data."""
+        data = self.coordinator.data
+        if data is None:
+            return None
+        return data.get(self._value_key, self._value_default)
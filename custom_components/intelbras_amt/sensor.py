@@ -10,11 +10,9 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_PORT, PERCENTAGE, EntityCategory
+from homeassistant.const import PERCENTAGE, EntityCategory
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DATA_BATTERY_LEVEL,
@@ -25,9 +23,9 @@ from .const import (
     DATA_ZONES_OPEN_COUNT,
     DATA_ZONES_VIOLATED_COUNT,
     DOMAIN,
-    ENTITY_PREFIX,
 )
 from .coordinator import AMTCoordinator
+from .entity import AMTValueEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -38,7 +36,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up sensors from a config entry."""
-    coordinator: AMTCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    coordinator: AMTCoordinator = hass.data[DOMAIN][entry.entry_id].coordinator
 
     entities: list[SensorEntity] = [
         AMTBatteryLevelSensor(coordinator, entry),
@@ -52,45 +50,17 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class AMTSensorBase(CoordinatorEntity[AMTCoordinator], SensorEntity):
+class AMTSensorBase(AMTValueEntity, SensorEntity):
     """Base class for AMT sensors."""
 
-    _attr_has_entity_name = True
-
-    def __init__(
-        self,
-        coordinator: AMTCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._entry = entry
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        model_name = "AMT"
-        if self.coordinator.data:
-            model_name = self.coordinator.data.get(DATA_MODEL_NAME, "AMT")
-
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name=f"{ENTITY_PREFIX.upper()} (porta {self._entry.data[CONF_PORT]})",
-            manufacturer="Intelbras",
-            model=model_name,
-        )
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        if not self.coordinator.data:
-            return False
-        return self.coordinator.data.get(DATA_CONNECTED, False)
+    _value_attr = "_attr_native_value"
 
 
 class AMTBatteryLevelSensor(AMTSensorBase):
     """Battery level sensor."""
 
+    _tracked_keys = frozenset((DATA_CONNECTED, DATA_BATTERY_LEVEL))
+    _value_key = DATA_BATTERY_LEVEL
     _attr_device_class = SensorDeviceClass.BATTERY
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = PERCENTAGE
@@ -106,17 +76,12 @@ class AMTBatteryLevelSensor(AMTSensorBase):
         super().__init__(coordinator, entry)
         self._attr_unique_id = f"{entry.entry_id}_battery_level"
 
-    @property
-    def native_value(self) -> int | None:
-        """Return the battery level."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get(DATA_BATTERY_LEVEL)
-
 
 class AMTModelSensor(AMTSensorBase):
     """Model sensor."""
 
+    _tracked_keys = frozenset((DATA_CONNECTED, DATA_MODEL_NAME))
+    _value_key = DATA_MODEL_NAME
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_name = "Modelo"
 
@@ -129,17 +94,12 @@ class AMTModelSensor(AMTSensorBase):
         super().__init__(coordinator, entry)
         self._attr_unique_id = f"{entry.entry_id}_model"
 
-    @property
-    def native_value(self) -> str | None:
-        """Return the model name."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get(DATA_MODEL_NAME)
-
 
 class AMTFirmwareSensor(AMTSensorBase):
     """Firmware version sensor."""
 
+    _tracked_keys = frozenset((DATA_CONNECTED, DATA_FIRMWARE))
+    _value_key = DATA_FIRMWARE
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_name = "Firmware"
 
@@ -152,17 +112,13 @@ class AMTFirmwareSensor(AMTSensorBase):
         super().__init__(coordinator, entry)
         self._attr_unique_id = f"{entry.entry_id}_firmware"
 
-    @property
-    def native_value(self) -> str | None:
-        """Return the firmware version."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get(DATA_FIRMWARE)
-
 
 class AMTZonesOpenCountSensor(AMTSensorBase):
     """Zones open count sensor."""
 
+    _tracked_keys = frozenset((DATA_CONNECTED, DATA_ZONES_OPEN_COUNT))
+    _value_key = DATA_ZONES_OPEN_COUNT
+    _value_default = 0
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_icon = "mdi:door-open"
     _attr_name = "Zonas Abertas"
@@ -176,17 +132,13 @@ class AMTZonesOpenCountSensor(AMTSensorBase):
         super().__init__(coordinator, entry)
         self._attr_unique_id = f"{entry.entry_id}_zones_open_count"
 
-    @property
-    def native_value(self) -> int | None:
-        """Return the number of open zones."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get(DATA_ZONES_OPEN_COUNT, 0)
-
 
 class AMTZonesViolatedCountSensor(AMTSensorBase):
     """Zones violated count sensor."""
 
+    _tracked_keys = frozenset((DATA_CONNECTED, DATA_ZONES_VIOLATED_COUNT))
+    _value_key = DATA_ZONES_VIOLATED_COUNT
+    _value_default = 0
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_icon = "mdi:alert-circle"
@@ -201,17 +153,13 @@ class AMTZonesViolatedCountSensor(AMTSensorBase):
         super().__init__(coordinator, entry)
         self._attr_unique_id = f"{entry.entry_id}_zones_violated_count"
 
-    @property
-    def native_value(self) -> int | None:
-        """Return the number of violated zones."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get(DATA_ZONES_VIOLATED_COUNT, 0)
-
 
 class AMTZonesBypassedCountSensor(AMTSensorBase):
     """Zones bypassed count sensor."""
 
+    _tracked_keys = frozenset((DATA_CONNECTED, DATA_ZONES_BYPASSED_COUNT))
+    _value_key = DATA_ZONES_BYPASSED_COUNT
+    _value_default = 0
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_icon = "mdi:shield-link-variant"
@@ -225,10 +173,3 @@ class AMTZonesBypassedCountSensor(AMTSensorBase):
         """Initialize the zones bypassed count sensor."""
         super().__init__(coordinator, entry)
         self._attr_unique_id = f"{entry.entry_id}_zones_bypassed_count"
-
-    @property
-    def native_value(self) -> int | None:
-        """Return the number of bypassed zones."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get(DATA_ZONES_BYPASSED_COUNT, 0)
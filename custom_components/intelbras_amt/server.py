@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+from functools import reduce
+from itertools import chain
 import logging
+from operator import xor
+import struct
 from typing import Any, Callable, Awaitable
 
 from .const import (
@@ -83,6 +87,81 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Zone flags the legacy protocol does not report; shared, never mutated.
+_NO_ZONES_TAMPER: tuple[bool, ...] = (False,) * MAX_ZONES_TAMPER
+_NO_ZONES_SHORT_CIRCUIT: tuple[bool, ...] = (False,) * MAX_ZONES_SHORT_CIRCUIT
+_NO_ZONES_LOW_BATTERY: tuple[bool, ...] = (False,) * MAX_ZONES_LOW_BATTERY
+
+# Fixed bytes around the password and command in every command frame.
+_FRAME_HEAD = bytes((FRAME_START, FRAME_SEPARATOR))
+_FRAME_TAIL = bytes((FRAME_SEPARATOR,))
+
+# Status content bytes read after the zone lists (model .. PGM/siren byte).
+_STATUS_CONTENT_LEN = 42
+
+# Scalar status bytes from content offset 24: model, firmware, partitions
+# A/B and C/D, power/battery, battery level, PGM/siren (bytes 29-38 skipped).
+_STATUS_SCALARS = struct.Struct("<BxBBB10xBBB")
+_STATUS_SCALARS_OFFSET = 24
+
+# (model name, zone count) for every possible model ID byte.
+_MODEL_INFO: tuple[tuple[str, int], ...] = tuple(
+    (
+        MODEL_NAMES.get(model_id, f"AMT (0x{model_id:02x})"),
+        MAX_ZONES_2018 if model_id == MODEL_AMT_2018 else MAX_ZONES_4010,
+    )
+    for model_id in range(256)
+)
+
+# Single-bit status flags: (data key, content offset, mask).
+_STATUS_FLAG_BITS: tuple[tuple[str, int, int], ...] = (
+    # Central status (byte 29)
+    (DATA_ARMED, 29, 0x08),
+    (DATA_STAY, 29, 0x10),
+    (DATA_TRIGGERED, 29, 0x04),
+    # Power/battery status (byte 39)
+    (DATA_AC_POWER, 39, 0x80),
+    (DATA_BATTERY_LOW, 39, 0x20),
+    # PGM/Siren status (byte 41)
+    (DATA_SIREN, 41, 0x01),
+)
+
+# Partition commands keyed by partition letter.
+_ARM_PARTITION_COMMANDS: dict[str, bytes] = {
+    "A": CMD_ARM_PARTITION_A,
+    "B": CMD_ARM_PARTITION_B,
+    "C": CMD_ARM_PARTITION_C,
+    "D": CMD_ARM_PARTITION_D,
+}
+_STAY_PARTITION_COMMANDS: dict[str, bytes] = {
+    "A": CMD_STAY_PARTITION_A,
+    "B": CMD_STAY_PARTITION_B,
+    "C": CMD_STAY_PARTITION_C,
+    "D": CMD_STAY_PARTITION_D,
+}
+_DISARM_PARTITION_COMMANDS: dict[str, bytes] = {
+    "A": CMD_DISARM_PARTITION_A,
+    "B": CMD_DISARM_PARTITION_B,
+    "C": CMD_DISARM_PARTITION_C,
+    "D": CMD_DISARM_PARTITION_D,
+}
+
+# PGM commands indexed by PGM number: prefix + two ASCII digits ("01".."19").
+# Index 0 is unused; activate/deactivate_pgm reject it before indexing.
+_PGM_ON_COMMANDS: tuple[bytes, ...] = tuple(
+    CMD_PGM_ON_PREFIX + f"{number:02d}".encode("ascii")
+    for number in range(MAX_PGMS + 1)
+)
+_PGM_OFF_COMMANDS: tuple[bytes, ...] = tuple(
+    CMD_PGM_OFF_PREFIX + f"{number:02d}".encode("ascii")
+    for number in range(MAX_PGMS + 1)
+)
+
+# Bits of every byte value, least significant first (zone 1 is bit 0).
+_BYTE_BITS: tuple[tuple[bool, ...], ...] = tuple(
+    tuple(bool(value & (1 << bit)) for bit in range(8)) for value in range(256)
+)
+
 
 class AMTServerError(Exception):
     """Base exception for AMT server errors."""
@@ -157,6 +236,11 @@ class AMTServer:
         self._running = False
         self._lock = asyncio.Lock()
         self._partition_passwords: dict[str, str] = {}
+        # Frame head + ASCII password, keyed by configured password string.
+        self._frame_prefixes: dict[str, bytes] = {}
+        # Complete frames for fixed commands, keyed by (command, password).
+        # Only configured passwords are cached; see _is_configured_password.
+        self._frames: dict[tuple[bytes, str], bytes] = {}
         self._status_callback: Callable[[dict[str, Any]], Awaitable[None]] | None = None
         self._last_status: dict[str, Any] | None = None
 
@@ -176,6 +260,21 @@ class AMTServer:
             self._partition_passwords["C"] = password_c
         if password_d:
             self._partition_passwords["D"] = password_d
+        # Drop frames built with partition passwords that were replaced.
+        self._frames.clear()
+        self._frame_prefixes.clear()
+
+    def _is_configured_password(self, password: str) -> bool:
+        """Return True for the panel password or a configured partition password.
+
+        Passwords arriving from control server requests are arbitrary; frames
+        built with them are never cached, so the caches stay bounded and do
+        not retain submitted (possibly wrong) passwords.
+        """
+        return (
+            password == self._password
+            or password in self._partition_passwords.values()
+        )
 
     def set_status_callback(
         self, callback: Callable[[dict[str, Any]], Awaitable[None]]
@@ -198,6 +297,8 @@ class AMTServer:
         if self._running:
             return
 
+        # The listener runs on Home Assistant's event loop. The loop (and its
+        # selector) is owned by HA core; the integration does not swap it.
         self._server = await asyncio.start_server(
             self._handle_client,
             self._host,
@@ -225,26 +326,29 @@ class AMTServer:
 
     def _calculate_checksum(self, data: bytes) -> int:
         """Calculate XOR checksum for the frame (XOR all bytes, then XOR with 0xFF)."""
-        checksum = 0
-        for byte in data:
-            checksum ^= byte
-        return checksum ^ 0xFF
+        return reduce(xor, data, 0xFF)
 
     def _build_frame(self, command: bytes, password: str | None = None) -> bytes:
         """Build a protocol frame with checksum."""
         pwd = password or self._password
-        # Password is sent as ASCII characters
-        pwd_bytes = pwd.encode('ascii')
+        prefix = self._frame_prefixes.get(pwd)
+        if prefix is None:
+            # Password is sent as ASCII characters
+            prefix = _FRAME_HEAD + pwd.encode('ascii')
+            if self._is_configured_password(pwd):
+                self._frame_prefixes[pwd] = prefix
 
         # Frame: [Length] [0xE9] [0x21] [PASSWORD_ASCII] [COMMAND] [0x21] [CHECKSUM]
-        inner = bytes([FRAME_START, FRAME_SEPARATOR]) + pwd_bytes + command + bytes([FRAME_SEPARATOR])
+        # Assembled in one buffer; byte 0 is filled in once the size is known.
+        frame = bytearray(1)
+        frame += prefix
+        frame += command
+        frame += _FRAME_TAIL
 
         # Length = command byte + content (not including length byte and checksum)
-        length = len(inner)
-
-        frame_without_checksum = bytes([length]) + inner
-        checksum = self._calculate_checksum(frame_without_checksum)
-        return frame_without_checksum + bytes([checksum])
+        frame[0] = len(frame) - 1
+        frame.append(self._calculate_checksum(frame))
+        return bytes(frame)
 
     def _build_ack_frame(self) -> bytes:
         """Build a simple ACK frame."""
@@ -274,7 +378,9 @@ class AMTServer:
             buffer = bytearray()
             while self._running:
                 try:
-                    data = await asyncio.wait_for(reader.read(1024), timeout=60)
+                    # A deadline scope instead of wait_for: no wrapper task per read.
+                    async with asyncio.timeout(60):
+                        data = await reader.read(1024)
                     if not data:
                         break
 
@@ -393,34 +499,54 @@ class AMTServer:
         connection.writer.write(ack)
         await connection.writer.drain()
 
-    async def _send_command(self, command: bytes, password: str | None = None) -> bytes:
-        """Send a command and wait for response."""
+    async def _send_command(
+        self, command: bytes, password: str | None = None, *, cache: bool = True
+    ) -> bytes:
+        """Send a command and wait for response.
+
+        Frames are cached per (command, password) for configured passwords
+        only, and never when cache is False, which callers with variable
+        payloads (bypass masks, raw commands) must pass.
+        """
         if not self._connection:
             raise AMTConnectionError("No panel connected")
 
+        pwd = password or self._password
+        if cache and self._is_configured_password(pwd):
+            key = (command, pwd)
+            frame = self._frames.get(key)
+            if frame is None:
+                frame = self._frames[key] = self._build_frame(command, pwd)
+        else:
+            frame = self._build_frame(command, pwd)
+
+        # The panel answers one frame at a time and replies are matched through
+        # the single pending_response future, so only the round trip is locked.
         async with self._connection._lock:
-            frame = self._build_frame(command, password)
             _LOGGER.debug("Sending command: %s", frame.hex())
 
             # Set up response future
             self._connection.pending_response = asyncio.get_event_loop().create_future()
 
             try:
-                self._connection.writer.write(frame)
-                await self._connection.writer.drain()
+                writer = self._connection.writer
+                writer.write(frame)
+                # Frames are tiny; only wait for flow control if they were buffered.
+                if writer.transport.get_write_buffer_size():
+                    await writer.drain()
 
                 # Wait for response
-                response = await asyncio.wait_for(
-                    self._connection.pending_response,
-                    timeout=RESPONSE_TIMEOUT,
-                )
+                async with asyncio.timeout(RESPONSE_TIMEOUT):
+                    response = await self._connection.pending_response
                 _LOGGER.debug("Response received: %s", response.hex())
 
-                # Check for NACK
-                if len(response) >= 3 and response[1] == FRAME_START:
-                    resp_content = response[2:-1]
-                    if len(resp_content) >= 1 and 0xE0 <= resp_content[0] <= 0xEF:
-                        raise AMTNackError(resp_content[0])
+                # Check for NACK: first content byte (before checksum) in 0xE0-0xEF
+                if (
+                    len(response) >= 4
+                    and response[1] == FRAME_START
+                    and response[2] & 0xF0 == 0xE0
+                ):
+                    raise AMTNackError(response[2])
 
                 return response
 
@@ -431,17 +557,15 @@ class AMTServer:
 
     def _parse_zones(self, data: bytes, offset: int, max_zones: int) -> list[bool]:
         """Parse zone status bytes into a list of booleans."""
-        zones = []
-        for byte_idx in range(8):  # 8 bytes = 64 zones max
-            if offset + byte_idx >= len(data):
-                break
-            byte = data[offset + byte_idx]
-            for bit in range(8):
-                zone_num = byte_idx * 8 + bit
-                if zone_num >= max_zones:
-                    break
-                zones.append(bool(byte & (1 << bit)))
-        return zones[:max_zones]
+        # 8 bytes = 64 zones max; a short response yields fewer zones.
+        zone_bytes = data[offset : offset + 8]
+        zones = list(chain.from_iterable(map(_BYTE_BITS.__getitem__, zone_bytes)))
+        del zones[max_zones:]
+        return zones
+
+    def _count_zones(self, data: bytes, offset: int) -> int:
+        """Count the set zone bits in the 8 bytes starting at offset."""
+        return int.from_bytes(data[offset : offset + 8], "little").bit_count()
 
     def _parse_partition_status(self, status_byte: int) -> dict[str, bool]:
         """Parse partition status byte."""
@@ -476,29 +600,38 @@ class AMTServer:
         zones_violated = self._parse_zones(content, 8, max_zones)
         zones_bypassed = self._parse_zones(content, 16, max_zones)
 
-        # Calculate zone counts
-        zones_open_count = sum(zones_open)
-        zones_violated_count = sum(zones_violated)
-        zones_bypassed_count = sum(zones_bypassed)
-
-        # Parse model ID from content (position may vary)
-        model_id = content[24] if len(content) > 24 else 0
-        model_name = MODEL_NAMES.get(model_id, f"AMT (0x{model_id:02x})")
-
-        # Adjust max zones based on model
-        if model_id == MODEL_AMT_2018:
-            max_zones = MAX_ZONES_2018
+        # Calculate zone counts (over all 64 zones, before any model trim)
+        zones_open_count = self._count_zones(content, 0)
+        zones_violated_count = self._count_zones(content, 8)
+        zones_bypassed_count = self._count_zones(content, 16)
+
+        # Pad once so the fixed-offset reads below need no length checks;
+        # zone lists above keep using the unpadded content.
+        status = content.ljust(_STATUS_CONTENT_LEN, b"\x00")
+        flags = {key: bool(status[offset] & mask) for key, offset, mask in _STATUS_FLAG_BITS}
+        (
+            model_id,
+            firmware_byte,
+            part_ab,
+            part_cd,
+            power_status,
+            battery_level,
+            pgm_byte,
+        ) = _STATUS_SCALARS.unpack_from(status, _STATUS_SCALARS_OFFSET)
+
+        # Model name and zone count (model ID position may vary)
+        model_name, max_zones = _MODEL_INFO[model_id]
+
+        # Trim zone lists for models with fewer zones
+        if max_zones < MAX_ZONES_4010:
             zones_open = zones_open[:max_zones]
             zones_violated = zones_violated[:max_zones]
             zones_bypassed = zones_bypassed[:max_zones]
 
         # Parse firmware
-        firmware_byte = content[26] if len(content) > 26 else 0
         firmware = f"{(firmware_byte >> 4) & 0x0F}.{firmware_byte & 0x0F}"
 
         # Parse partition status
-        part_ab = content[27] if len(content) > 27 else 0
-        part_cd = content[28] if len(content) > 28 else 0
         partitions = {
             "A": self._parse_partition_status(part_ab & 0x0F),
             "B": self._parse_partition_status((part_ab >> 4) & 0x0F),
@@ -506,34 +639,17 @@ class AMTServer:
             "D": self._parse_partition_status((part_cd >> 4) & 0x0F),
         }
 
-        # Parse central status
-        central_status = content[29] if len(content) > 29 else 0
-        armed = bool(central_status & 0x08)
-        stay = bool(central_status & 0x10)
-        triggered = bool(central_status & 0x04)
-
-        # Parse power/battery status
-        power_status = content[39] if len(content) > 39 else 0
-        ac_power = bool(power_status & 0x80)
-        battery_connected = not bool(power_status & 0x40)
-        battery_low = bool(power_status & 0x20)
+        # Battery presence is reported inverted (bit set = battery missing)
+        battery_connected = not power_status & 0x40
+        battery_low = flags[DATA_BATTERY_LOW]
 
         # Battery level
-        battery_level = content[40] if len(content) > 40 else 0
-        if battery_level > 100:
-            battery_level = 100
+        battery_level = min(battery_level, 100)
 
-        # PGM/Siren status
-        pgm_byte = content[41] if len(content) > 41 else 0
-        siren = bool(pgm_byte & 0x01)
+        # PGM status: bits 1-7 of the PGM/Siren byte
         pgms = [False] * MAX_PGMS
-        for i in range(min(8, MAX_PGMS)):
-            pgms[i] = bool(pgm_byte & (1 << (i + 1))) if i < 7 else False
-
-        # Initialize empty tamper/short-circuit/low-battery arrays
-        zones_tamper = [False] * MAX_ZONES_TAMPER
-        zones_short_circuit = [False] * MAX_ZONES_SHORT_CIRCUIT
-        zones_low_battery = [False] * MAX_ZONES_LOW_BATTERY
+        for i in range(min(7, MAX_PGMS)):
+            pgms[i] = bool(pgm_byte & (1 << (i + 1)))
 
         return {
             DATA_CONNECTED: True,
@@ -544,23 +660,18 @@ class AMTServer:
             DATA_ZONES_OPEN: zones_open,
             DATA_ZONES_VIOLATED: zones_violated,
             DATA_ZONES_BYPASSED: zones_bypassed,
-            DATA_ZONES_TAMPER: zones_tamper,
-            DATA_ZONES_SHORT_CIRCUIT: zones_short_circuit,
-            DATA_ZONES_LOW_BATTERY: zones_low_battery,
+            DATA_ZONES_TAMPER: _NO_ZONES_TAMPER,
+            DATA_ZONES_SHORT_CIRCUIT: _NO_ZONES_SHORT_CIRCUIT,
+            DATA_ZONES_LOW_BATTERY: _NO_ZONES_LOW_BATTERY,
             DATA_ZONES_OPEN_COUNT: zones_open_count,
             DATA_ZONES_VIOLATED_COUNT: zones_violated_count,
             DATA_ZONES_BYPASSED_COUNT: zones_bypassed_count,
             DATA_PARTITIONS: partitions,
-            DATA_ARMED: armed,
-            DATA_STAY: stay,
-            DATA_TRIGGERED: triggered,
-            DATA_AC_POWER: ac_power,
+            **flags,
             DATA_BATTERY_CONNECTED: battery_connected,
             DATA_BATTERY_LEVEL: battery_level,
-            DATA_SIREN: siren,
             DATA_PGMS: pgms,
             DATA_PROBLEM: battery_low or not battery_connected,
-            DATA_BATTERY_LOW: battery_low,
             DATA_BATTERY_ABSENT: not battery_connected,
             DATA_BATTERY_SHORT: False,
             DATA_AUX_OVERLOAD: False,
@@ -594,67 +705,44 @@ class AMTServer:
 
     async def arm_partition(self, partition: str, password: str | None = None) -> None:
         """Arm a specific partition."""
-        commands = {
-            "A": CMD_ARM_PARTITION_A,
-            "B": CMD_ARM_PARTITION_B,
-            "C": CMD_ARM_PARTITION_C,
-            "D": CMD_ARM_PARTITION_D,
-        }
-        if partition not in commands:
+        command = _ARM_PARTITION_COMMANDS.get(partition)
+        if command is None:
             raise ValueError(f"Invalid partition: {partition}")
 
         pwd = password or self._partition_passwords.get(partition) or self._password
-        await self._send_command(commands[partition], pwd)
+        await self._send_command(command, pwd)
 
     async def arm_stay_partition(self, partition: str, password: str | None = None) -> None:
         """Arm a specific partition in stay mode."""
-        commands = {
-            "A": CMD_STAY_PARTITION_A,
-            "B": CMD_STAY_PARTITION_B,
-            "C": CMD_STAY_PARTITION_C,
-            "D": CMD_STAY_PARTITION_D,
-        }
-        if partition not in commands:
+        command = _STAY_PARTITION_COMMANDS.get(partition)
+        if command is None:
             raise ValueError(f"Invalid partition: {partition}")
 
         pwd = password or self._partition_passwords.get(partition) or self._password
-        await self._send_command(commands[partition], pwd)
+        await self._send_command(command, pwd)
 
     async def disarm_partition(self, partition: str, password: str | None = None) -> None:
         """Disarm a specific partition."""
-        commands = {
-            "A": CMD_DISARM_PARTITION_A,
-            "B": CMD_DISARM_PARTITION_B,
-            "C": CMD_DISARM_PARTITION_C,
-            "D": CMD_DISARM_PARTITION_D,
-        }
-        if partition not in commands:
+        command = _DISARM_PARTITION_COMMANDS.get(partition)
+        if command is None:
             raise ValueError(f"Invalid partition: {partition}")
 
         pwd = password or self._partition_passwords.get(partition) or self._password
-        await self._send_command(commands[partition], pwd)
+        await self._send_command(command, pwd)
 
     async def activate_pgm(self, pgm_number: int) -> None:
         """Activate a PGM output."""
         if pgm_number < 1 or pgm_number > MAX_PGMS:
             raise ValueError(f"Invalid PGM number: {pgm_number}")
 
-        if pgm_number < 10:
-            command = CMD_PGM_ON_PREFIX + bytes([0x30, 0x30 + pgm_number])
-        else:
-            command = CMD_PGM_ON_PREFIX + bytes([0x31, 0x30 + (pgm_number - 10)])
-        await self._send_command(command)
+        await self._send_command(_PGM_ON_COMMANDS[pgm_number])
 
     async def deactivate_pgm(self, pgm_number: int) -> None:
         """Deactivate a PGM output."""
         if pgm_number < 1 or pgm_number > MAX_PGMS:
             raise ValueError(f"Invalid PGM number: {pgm_number}")
 
-        if pgm_number < 10:
-            command = CMD_PGM_OFF_PREFIX + bytes([0x30, 0x30 + pgm_number])
-        else:
-            command = CMD_PGM_OFF_PREFIX + bytes([0x31, 0x30 + (pgm_number - 10)])
-        await self._send_command(command)
+        await self._send_command(_PGM_OFF_COMMANDS[pgm_number])
 
     async def siren_on(self) -> None:
         """Turn siren on."""
@@ -666,16 +754,13 @@ class AMTServer:
 
     async def bypass_zones(self, zone_mask: list[bool]) -> None:
         """Bypass zones specified in the mask."""
-        mask_bytes = []
-        for i in range(0, len(zone_mask), 8):
-            byte = 0
-            for bit in range(8):
-                if i + bit < len(zone_mask) and zone_mask[i + bit]:
-                    byte |= 1 << bit
-            mask_bytes.append(byte)
+        # Pack zone 1 into bit 0 of the first byte: read the mask as a binary
+        # number with the last zone as the most significant digit.
+        bits = "".join(["1" if bypass else "0" for bypass in reversed(zone_mask)])
+        mask_bytes = int(bits or "0", 2).to_bytes((len(zone_mask) + 7) // 8, "little")
 
-        command = CMD_BYPASS + bytes(mask_bytes)
-        await self._send_command(command)
+        command = CMD_BYPASS + mask_bytes
+        await self._send_command(command, cache=False)
 
     async def bypass_open_zones(self, open_zones: list[bool]) -> None:
         """Bypass all currently open zones."""
@@ -702,9 +787,17 @@ class AMTServer:
             dict with 'success', 'response_hex', 'error' keys
         """
         try:
-            command_bytes = bytes.fromhex(command_hex.replace(" ", ""))
+            try:
+                # Plain hex (optionally space-separated) needs no cleanup pass.
+                command_bytes = bytes.fromhex(command_hex)
+            except ValueError:
+                command_bytes = bytes.fromhex(command_hex.replace(" ", ""))
+        except ValueError:
+            return {"success": False, "error": "Invalid hex command format"}
+
+        try:
             _LOGGER.info("Sending raw command: %s", command_bytes.hex())
-            response = await self._send_command(command_bytes, password)
+            response = await self._send_command(command_bytes, password, cache=False)
             _LOGGER.info("Raw command response: %s", response.hex())
             return {
                 "success": True,